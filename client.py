@@ -13,15 +13,23 @@
 # limitations under the License.
 
 import os
+import time
 import uuid
-import asyncio
+import logging
 import requests
 import warnings
+import threading
 import streamlit as st
 
 from PIL import Image
 from io import BytesIO
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import (
+    add_script_run_ctx,
+    get_script_run_ctx
+)
 
 from static.firestore import UserActivityCollection
 from toolbox_agent.runner import initialize_adk, run_adk_sync
@@ -41,73 +49,62 @@ load_dotenv(dotenv_path)
 
 os.environ['GOOGLE_API_KEY'] = st.secrets['GOOGLE_API_KEY']
 
-st.html(
-    """
-    <style>
-        section[data-testid="stSidebar"] {
-            width: 325px !important;
-        }
-    </style>
-    """
-)
+logger = logging.getLogger(__name__)
 
-st.html(
-    "<style>[data-testid='stHeaderActionElements'] {display: none;}</style>"
+http_session = requests.Session()
+http_session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=16)
 )
 
-st.markdown(
+@st.cache_data(show_spinner=False)
+def load_css(path):
+    with open(path) as css_file:
+        return css_file.read()
+
+try:
+    client_home_css = load_css("static/css/client_home.css")
+
+except OSError as error:
+    logger.warning("Failed to load the client stylesheet", exc_info=error)
+    client_home_css = ""
+
+CLIENT_CSS = "<style>" + "".join([
+    """
+    section[data-testid="stSidebar"] {
+        width: 325px !important;
+    }
+    """,
+    """
+    [data-testid='stHeaderActionElements'] {
+        display: none;
+    }
+    """,
     """
-    <style>
     section[data-testid="stSidebar"] > div:first-child {
         height: 100vh;
         overflow: hidden;
     }
-    </style>
     """,
-    unsafe_allow_html=True
-)
-
-st.markdown(
     """
-        <style>
-               .block-container {
-                    padding-top: 0.2rem;
-                    padding-bottom: 1.55rem;
-                }
-        </style>
-        """,
-    unsafe_allow_html=True,
-)
-
-try:
-    with open("static/css/client_home.css") as f:
-        css = f.read()
-
-    st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
-
-except Exception as error:
-    pass
-
-st.markdown(
+    .block-container {
+        padding-top: 0.2rem;
+        padding-bottom: 1.55rem;
+    }
+    """,
     """
-    <style> 
-        #MainMenu  {visibility: hidden;}
-        footer {visibility: hidden;}
-    </style>
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
     """,
-    unsafe_allow_html=True,
-)
-
-st.markdown(
     """
-    <style>
-        .stMarkdown a {
-            text-decoration: none;
-        }
-    </style>
+    .stMarkdown a {
+        text-decoration: none;
+    }
     """,
-    unsafe_allow_html=True,
-)
+    client_home_css,
+]) + "</style>"
+
+st.html(CLIENT_CSS)
 
 if "user_id" not in st.session_state:
     st.session_state.user_id = ""
@@ -149,9 +146,37 @@ if "themes" not in st.session_state:
     }
     st.rerun()
 
-@st.cache_data
+@st.cache_resource
+def get_user_activity_collection():
+    return UserActivityCollection()
+
+@st.cache_resource
+def get_background_executor():
+    return ThreadPoolExecutor(max_workers=2)
+
+def submit_in_background(fn, *args, **kwargs):
+    script_run_ctx = get_script_run_ctx()
+
+    def run_with_script_run_ctx():
+        add_script_run_ctx(threading.current_thread(), script_run_ctx)
+        return fn(*args, **kwargs)
+
+    future = get_background_executor().submit(run_with_script_run_ctx)
+    future.add_done_callback(log_background_failure)
+
+    return future
+
+def log_background_failure(future):
+    if future.cancelled() or future.exception() is None:
+        return
+
+    logger.error(
+        "Background task failed", exc_info=future.exception()
+    )
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
 def fetch_and_cache_recent_conversations(session_id, user_id, limit):
-    user_activity_collection = UserActivityCollection()
+    user_activity_collection = get_user_activity_collection()
 
     recent_conversations = user_activity_collection.fetch_latest_conversations(
         uid=user_id,
@@ -160,28 +185,23 @@ def fetch_and_cache_recent_conversations(session_id, user_id, limit):
 
     return recent_conversations
 
-def load_image_safe(path_or_url):
-    try:
-        if path_or_url.startswith("http"):
-            response = requests.get(path_or_url, timeout=5)
-            response.raise_for_status()
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_image_bytes(path_or_url):
+    if path_or_url.startswith("http"):
+        response = http_session.get(path_or_url, timeout=5)
+        response.raise_for_status()
 
-            return Image.open(BytesIO(response.content))
-        
-        else:
-            if os.path.exists(path_or_url):
-                return Image.open(path_or_url)
+        return response.content
 
-            else:
-                raise FileNotFoundError
+    with open(path_or_url, "rb") as image_file:
+        return image_file.read()
 
-    except Exception:
-        if st.session_state.themes['current_theme'] == 'light':
-            placeholder_user = "static/images/placeholder/user.png"
-        else:
-            placeholder_user = "static/images/placeholder/user_dark.png"
+def load_image_safe(path_or_url):
+    try:
+        return Image.open(BytesIO(load_image_bytes(path_or_url)))
 
-        return Image.open(placeholder_user)
+    except Exception:
+        return Image.open(ICONS["user"])
 
 def change_streamlit_theme():
     previous_theme = st.session_state.themes["current_theme"]
@@ -204,15 +224,49 @@ def change_streamlit_theme():
         st.session_state.themes["current_theme"] = "dark"
 
 
-if st.session_state.themes["refreshed"] == False:
+# Theme options are sent when the script starts, before on_click callbacks
+# run, so one extra rerun is needed for a toggle to reach the page.
+if not st.session_state.themes["refreshed"]:
     st.session_state.themes["refreshed"] = True
     st.rerun()
 
 
-if st.session_state.themes["current_theme"] == "dark":
-    AVATAR_AGENT = "static/images/placeholder/agent_dark.png"
-else:
-    AVATAR_AGENT = "static/images/placeholder/agent_light.png"
+STREAM_FRAME_INTERVAL = 0.016
+STREAM_FRAME_MAX_CHARS = 64
+STREAM_FRAME_DELAY = 0.025
+
+
+THEMED_IMAGES = {
+    "light": {
+        "agent": "static/images/placeholder/agent_light.png",
+        "user": "static/images/placeholder/user.png",
+        "favicon": "static/images/placeholder/favicon.png",
+        "login_title": "static/images/placeholder/login_title_light.png",
+        "login_banner": "static/images/placeholder/login_banner_light.png",
+        "logo": "static/images/placeholder/logo_light.png",
+        "drive": "static/images/icons/drive_icon.png",
+        "gmail": "static/images/icons/gmail_icon.png",
+        "calendar": "static/images/icons/calendar_icon.png",
+        "gmeet": "static/images/icons/gmeet_icon.png",
+        "tasks": "static/images/icons/tasks_icon.png",
+    },
+    "dark": {
+        "agent": "static/images/placeholder/agent_dark.png",
+        "user": "static/images/placeholder/user_dark.png",
+        "favicon": "static/images/placeholder/favicon_dark.png",
+        "login_title": "static/images/placeholder/login_title_dark.png",
+        "login_banner": "static/images/placeholder/login_banner_dark.png",
+        "logo": "static/images/placeholder/logo_dark.png",
+        "drive": "static/images/icons/drive_icon_dark.png",
+        "gmail": "static/images/icons/gmail_icon_dark.png",
+        "calendar": "static/images/icons/calendar_icon_dark.png",
+        "gmeet": "static/images/icons/gmeet_icon_dark.png",
+        "tasks": "static/images/icons/tasks_icon_dark.png",
+    },
+}
+
+ICONS = THEMED_IMAGES[st.session_state.themes["current_theme"]]
+AVATAR_AGENT = ICONS["agent"]
 
 
 if __name__ == "__main__":
@@ -226,18 +280,12 @@ if __name__ == "__main__":
         with login_col:
             cola, _ = st.columns([1, 9], vertical_alignment='center')
 
-            if st.session_state.themes['current_theme'] == 'light':
-                cola.image("static/images/placeholder/favicon.png")
-            else:
-                cola.image("static/images/placeholder/favicon_dark.png")
+            cola.image(ICONS["favicon"])
 
             st.markdown("<BR>"*3, unsafe_allow_html=True)
             st.write(" ")
 
-            if st.session_state.themes['current_theme'] == 'light':
-                st.image("static/images/placeholder/login_title_light.png")
-            else:
-                st.image("static/images/placeholder/login_title_dark.png")
+            st.image(ICONS["login_title"])
 
             st.markdown(
                 """<font size=6>
@@ -269,10 +317,7 @@ if __name__ == "__main__":
         with banner_col:
             st.write(" ")
 
-            if st.session_state.themes['current_theme'] == 'light':
-                st.image("static/images/placeholder/login_banner_light.png")
-            else:
-                st.image("static/images/placeholder/login_banner_dark.png")
+            st.image(ICONS["login_banner"])
     
         st.stop()
 
@@ -301,11 +346,14 @@ if __name__ == "__main__":
 
         st.stop()
 
+    themes = st.session_state.themes
+    is_dark_theme = themes["current_theme"] == "dark"
+    user_id = st.session_state.user_id
+    user_details = st.session_state.user_details
+    messages = st.session_state["messages"]
+
     with st.sidebar:
-        if st.session_state.themes['current_theme'] == 'light':
-            st.image("static/images/placeholder/logo_light.png")
-        else:
-            st.image("static/images/placeholder/logo_dark.png")
+        st.image(ICONS["logo"])
 
         st.markdown("---")
 
@@ -317,14 +365,9 @@ if __name__ == "__main__":
             )
 
             with colx:
-                if st.session_state.themes['current_theme'] == 'light':
-                    placeholder_user = "static/images/placeholder/user.png"
-                else:
-                    placeholder_user = "static/images/placeholder/user_dark.png"
-
                 profile_picture_url = load_image_safe(
-                    st.session_state.user_details.get(
-                        "picture", placeholder_user
+                    user_details.get(
+                        "picture", ICONS["user"]
                     )
                 )
 
@@ -334,16 +377,16 @@ if __name__ == "__main__":
                 )
 
             with coly:
-                if st.session_state.themes["current_theme"] == "dark":
+                if is_dark_theme:
                     subtitle_color = "#BDC1C6"
                 else:
                     subtitle_color = "#45494E"
 
                 st.markdown(
                     f"""<B>
-                    {st.session_state.user_details.get("name", "User")}
+                    {user_details.get("name", "User")}
                     </B><BR><font color="{subtitle_color}">
-                    Username: {st.session_state.user_details.get(
+                    Username: {user_details.get(
                         "email", 
                         "Not Available"
                     ).split("@")[0]}</font>
@@ -361,37 +404,17 @@ if __name__ == "__main__":
                     gap='small'
                 )
 
-                if st.session_state.themes["current_theme"] == "dark":
-                    icon_path = "static/images/icons/drive_icon_dark.png"
-                else:
-                    icon_path = "static/images/icons/drive_icon.png"
-
                 with cola:
-                    st.image(icon_path, width="stretch")
+                    st.image(ICONS["drive"], width="stretch")
                 
-                if st.session_state.themes["current_theme"] == "dark":
-                    icon_path = "static/images/icons/gmail_icon_dark.png"
-                else:
-                    icon_path = "static/images/icons/gmail_icon.png"
-
                 with colb:
-                    st.image(icon_path, width="stretch")
-
-                if st.session_state.themes["current_theme"] == "dark":
-                    icon_path = "static/images/icons/calendar_icon_dark.png"
-                else:
-                    icon_path = "static/images/icons/calendar_icon.png"
+                    st.image(ICONS["gmail"], width="stretch")
 
                 with colc:
-                    st.image(icon_path, width="stretch")
-
-                if st.session_state.themes["current_theme"] == "dark":
-                    icon_path = "static/images/icons/gmeet_icon_dark.png"
-                else:
-                    icon_path = "static/images/icons/gmeet_icon.png"
+                    st.image(ICONS["calendar"], width="stretch")
 
                 with cold:
-                    st.image(icon_path, width="stretch")
+                    st.image(ICONS["gmeet"], width="stretch")
 
                 cola, colb, colc, cold = st.columns(
                     4, 
@@ -399,13 +422,8 @@ if __name__ == "__main__":
                     gap='small'
                 )
 
-                if st.session_state.themes["current_theme"] == "dark":
-                    icon_path = "static/images/icons/tasks_icon_dark.png"
-                else:
-                    icon_path = "static/images/icons/tasks_icon.png"
-
                 with cola:
-                    st.image(icon_path, width="stretch")
+                    st.image(ICONS["tasks"], width="stretch")
 
         st.markdown("---")
 
@@ -429,11 +447,7 @@ if __name__ == "__main__":
                 except Exception as error: pass
         
         with colb:
-            btn_face = (
-                st.session_state.themes["light"]["button_face"]
-                if st.session_state.themes["current_theme"] == "light"
-                else st.session_state.themes["dark"]["button_face"]
-            )
+            btn_face = themes[themes["current_theme"]]["button_face"]
 
             st.button(
                 "",
@@ -457,16 +471,11 @@ if __name__ == "__main__":
                 st.logout()
                 st.stop()
 
-    if st.session_state.themes['current_theme'] == 'light':
-        placeholder_user = "static/images/placeholder/user.png"
-    else:
-        placeholder_user = "static/images/placeholder/user_dark.png"
-
-    profile_picture_url = st.session_state.user_details.get(
-        "picture", placeholder_user
+    profile_picture_url = user_details.get(
+        "picture", ICONS["user"]
     )
 
-    for message in st.session_state['messages']:
+    for message in messages:
         if message["role"] == "user":
             avatar_url = profile_picture_url
         else:
@@ -476,7 +485,7 @@ if __name__ == "__main__":
             st.markdown(message["content"], unsafe_allow_html=False)
     
     if prompt := st.chat_input("Type your question here..."):
-        st.session_state['messages'].append(
+        messages.append(
             {"role": "user", "content": prompt}
         )
 
@@ -489,7 +498,7 @@ if __name__ == "__main__":
             with st.spinner("Thinking.....", show_time=True):
                 try:
                     agent_response = run_adk_sync(
-                        st.session_state.user_id, 
+                        user_id, 
                         adk_runner, 
                         current_session_id, 
                         prompt
@@ -499,30 +508,45 @@ if __name__ == "__main__":
                     agent_response = """Sorry, an error occurred while 
                     processing your request. Please try again later."""
 
-                st.session_state.messages.append(
+                messages.append(
                     {
                         "role": "assistant", 
                         "content": agent_response
                     }
                 )
 
-                user_activity_collection = UserActivityCollection()
+                user_activity_collection = get_user_activity_collection()
 
-                user_activity_collection.add_chat_to_adk_session_id(
-                    uid=st.session_state.user_id,
+                submit_in_background(
+                    user_activity_collection.add_chat_to_adk_session_id,
+                    uid=user_id,
                     adk_session_id=st.session_state.adk_session_id,
                     query=str(prompt),
                     response=str(agent_response)
                 )
 
             def response_generator(response):
-                for word in response:
-                    asyncio.run(asyncio.sleep(0.025))
+                buffer = ""
+                last_flush = time.monotonic()
 
+                for word in response:
                     try:
-                        yield word.text
+                        buffer += word.text
                     except Exception as err:
-                        yield word
+                        buffer += word
+
+                    if (
+                        time.monotonic() - last_flush > STREAM_FRAME_INTERVAL
+                        or len(buffer) > STREAM_FRAME_MAX_CHARS
+                    ):
+                        yield buffer
+
+                        buffer = ""
+                        time.sleep(STREAM_FRAME_DELAY)
+                        last_flush = time.monotonic()
+
+                if buffer:
+                    yield buffer
 
             try:
                 response = st.write_stream(
@@ -538,12 +562,12 @@ if __name__ == "__main__":
                     response_generator(fallback_message)
                 )
     
-    if not st.session_state['messages']:
+    if not messages:
         st.markdown(
             f"""
             <BR><BR><BR><BR><BR>
             <H1 class='h1-home-welcome-title'>
-                Hello, {st.session_state.user_details.get("given_name", "User")}
+                Hello, {user_details.get("given_name", "User")}
             </H1>
             """,
             unsafe_allow_html=True,
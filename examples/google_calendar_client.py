@@ -14,7 +14,9 @@
 
 import os
 import time
+import random
 import asyncio
+from collections import deque
 from dotenv import load_dotenv
 
 from google import genai
@@ -43,25 +45,26 @@ google_calendar_mcp_server_params = StdioServerParameters(
 
 
 def clean_schema(schema):
-    if isinstance(schema, dict):
-        schema_copy = schema.copy()
+    pending = deque([schema])
 
-        if "additionalProperties" in schema_copy:
-            del schema_copy["additionalProperties"]
-        if "$schema" in schema_copy:
-            del schema_copy["$schema"]
+    while pending:
+        node = pending.popleft()
 
-        for key, value in schema_copy.items():
-            if isinstance(value, (dict, list)):
-                schema_copy[key] = clean_schema(value)
+        if isinstance(node, dict):
+            node.pop("additionalProperties", None)
+            node.pop("$schema", None)
 
-        return schema_copy
+            pending.extend(
+                value for value in node.values()
+                if isinstance(value, (dict, list))
+            )
 
-    elif isinstance(schema, list):
-        return [clean_schema(item) for item in schema]
+        elif isinstance(node, list):
+            pending.extend(
+                item for item in node if isinstance(item, (dict, list))
+            )
 
-    else:
-        return schema
+    return schema
 
 
 def generate_response(contents, tools=None, retries=3, backoff=60):
@@ -80,17 +83,45 @@ def generate_response(contents, tools=None, retries=3, backoff=60):
 
         except Exception as error:
             if "RESOURCE_EXHAUSTED" in str(error):
-                wait_time = backoff * (attempt + 1)
+                wait_time = min(backoff * (2 ** attempt), 300) + (
+                    random.uniform(0, backoff / 2)
+                )
 
                 print(
-                    f"... Gemini quota hit. Waiting {wait_time}s before retry."
-                    f" (Attempt {attempt + 1}/3)"
+                    f"... Gemini quota hit. Waiting {wait_time:.1f}s before "
+                    f"retry. (Attempt {attempt + 1}/{retries})"
                 )
                 time.sleep(wait_time)
 
     raise RuntimeError(">>> Failed after max retries due to quota limits.")
 
 
+def extract_function_calls(parts):
+    return [
+        part.function_call
+        for part in parts
+        if getattr(part, "function_call", None) is not None
+        and getattr(part.function_call, "name", None)
+    ]
+
+
+async def load_mcp_tools(mcp_session):
+    mcp_tools = await mcp_session.list_tools()
+
+    tools = types.Tool(
+        function_declarations=[
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "parameters": clean_schema(tool.inputSchema),
+            }
+            for tool in mcp_tools.tools
+        ]
+    )
+
+    return tools, frozenset(tool.name for tool in mcp_tools.tools)
+
+
 async def google_calendar_client():
     try:
         async with stdio_client(google_calendar_mcp_server_params) as (
@@ -102,29 +133,27 @@ async def google_calendar_client():
             ) as mcp_session:
                 await mcp_session.initialize()
 
-                google_calendar_mcp_tools = await mcp_session.list_tools()
-
-                google_calendar_tools = types.Tool(
-                    function_declarations=[
-                        {
-                            "name": tool.name,
-                            "description": tool.description,
-                            "parameters": clean_schema(tool.inputSchema),
-                        }
-                        for tool in google_calendar_mcp_tools.tools
-                    ]
+                google_calendar_tools_task = asyncio.create_task(
+                    load_mcp_tools(mcp_session)
                 )
 
                 contents = []
 
                 while True:
-                    prompt = str(input(
-                        "\n>>> Enter your query (or type 'exit' to quit): "))
+                    prompt = str(await asyncio.to_thread(
+                        input,
+                        "\n>>> Enter your query (or type 'exit' to quit): "
+                    ))
 
                     if prompt.lower() in ["exit", "quit"]:
+                        google_calendar_tools_task.cancel()
                         print("... Exiting. Goodbye!\n")
                         break
 
+                    google_calendar_tools, google_calendar_tool_names = (
+                        await google_calendar_tools_task
+                    )
+
                     contents.append(
                         types.Content(
                             role="user", parts=[types.Part(text=prompt)]
@@ -133,58 +162,51 @@ async def google_calendar_client():
 
                     response = generate_response(
                         contents, google_calendar_tools)
+                    response_content = response.candidates[0].content
+
+                    for function in extract_function_calls(
+                        response_content.parts
+                    ):
+                        print(
+                            f"\n... Detected function call: "
+                            f"{function.name} with args: "
+                            f"{function.args}"
+                        )
+
+                        if function.name in google_calendar_tool_names:
+                            result = await mcp_session.call_tool(
+                                function.name, function.args
+                            )
+
+                            print(
+                                f"... Executed function: "
+                                f"{function.name} "
+                                f"with args: {function.args}\n"
+                            )
+
+                            function_response_part = (
+                                types.Part.from_function_response(
+                                    name=function.name,
+                                    response={"result": result},
+                                )
+                            )
+
+                            contents.append(response_content)
 
-                    for part in response.candidates[0].content.parts:
-                        if (
-                            hasattr(part, "function_call")
-                            and part.function_call is not None
-                        ):
-                            function = part.function_call
-
-                            if hasattr(function, "name") and function.name:
-                                print(
-                                    f"\n... Detected function call: "
-                                    f"{function.name} with args: "
-                                    f"{function.args}"
+                            contents.append(
+                                types.Content(
+                                    role="user", 
+                                    parts=[function_response_part]
                                 )
+                            )
 
-                                if function.name in [
-                                    tool.name 
-                                    for tool in google_calendar_mcp_tools.tools
-                                ]:
-                                    result = await mcp_session.call_tool(
-                                        function.name, function.args
-                                    )
-
-                                    print(
-                                        f"... Executed function: "
-                                        f"{function.name} "
-                                        f"with args: {function.args}\n"
-                                    )
-
-                                    function_response_part = (
-                                        types.Part.from_function_response(
-                                            name=function.name,
-                                            response={"result": result},
-                                        )
-                                    )
-
-                                    contents.append(
-                                        response.candidates[0].content)
-
-                                    contents.append(
-                                        types.Content(
-                                            role="user", 
-                                            parts=[function_response_part]
-                                        )
-                                    )
-
-                                    response = generate_response(
-                                        contents, google_calendar_tools
-                                    )
+                            response = generate_response(
+                                contents, google_calendar_tools
+                            )
+                            response_content = response.candidates[0].content
 
                     print(f">>> Response:\n{response.text}")
-                    contents.append(response.candidates[0].content)
+                    contents.append(response_content)
 
     except* Exception as eg:
         for error in eg.exceptions:
@@ -13,18 +13,36 @@
 # limitations under the License.
 
 import os
+import time
 import asyncio
 import logging
 import argparse
+import threading
 import traceback
+from typing import Optional, Tuple
 
-from googleapiclient.discovery import build
+from googleapiclient.http import build_http
+from googleapiclient.discovery import build, Resource
+from googleapiclient.model import JsonModel
+from google_auth_httplib2 import AuthorizedHttp
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+GMAIL_SERVICE_MAX_AGE_SECONDS = 25 * 60
+
+# (service, credentials, expires_at), always replaced by a single assignment
+# so the lock-free fast path never sees a half-updated state.
+_gmail_state: Optional[Tuple[Resource, Credentials, float]] = None
+_gmail_service_lock = threading.Lock()
+
 
 def parse_args():
     parser = argparse.ArgumentParser(description="GMail MCP Server")
@@ -37,7 +55,101 @@ def parse_args():
     return parser.parse_args()
 
 
-def _init_gmail_service() -> Credentials:
+class _OrjsonModel(JsonModel):
+    # Parses API responses with orjson, including every part of a batch
+    # response; anything orjson rejects goes through the stock JsonModel.
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+
+        return body
+
+
+class _ThreadLocalAuthorizedHttp:
+    # httplib2.Http is not thread-safe, so every worker of the Gmail I/O
+    # pool gets its own AuthorizedHttp and keeps its connection warm.
+    def __init__(self, credentials: Credentials):
+        self.credentials = credentials
+        self._local = threading.local()
+
+    def _get_http(self) -> AuthorizedHttp:
+        http = getattr(self._local, "http", None)
+
+        if http is None:
+            http = AuthorizedHttp(self.credentials, http=build_http())
+            self._local.http = http
+
+        return http
+
+    def request(self, *args, **kwargs):
+        return self._get_http().request(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._get_http(), name)
+
+
+def _get_usable_gmail_service() -> Optional[Resource]:
+    state = _gmail_state
+
+    if state is None:
+        return None
+
+    service, credentials, expires_at = state
+
+    if credentials.valid and time.monotonic() < expires_at:
+        return service
+
+    return None
+
+
+def _init_gmail_service() -> Resource:
+    global _gmail_state
+
+    with _gmail_service_lock:
+        if (service := _get_usable_gmail_service()) is not None:
+            return service
+
+        state = _gmail_state
+
+        if (
+            state is not None
+            and time.monotonic() < state[2]
+            and state[1].refresh_token
+        ):
+            # Only the token ran out: refresh the shared credentials once,
+            # under the lock, and keep the service and its connections.
+            try:
+                state[1].refresh(Request())
+                return state[0]
+
+            except Exception as error:
+                logger.warning(
+                    "Token refresh failed, rebuilding Gmail", exc_info=error
+                )
+
+        service, credentials = _build_gmail_service()
+        _gmail_state = (
+            service,
+            credentials,
+            time.monotonic() + GMAIL_SERVICE_MAX_AGE_SECONDS
+        )
+        return service
+
+
+def invalidate_gmail_service() -> None:
+    global _gmail_state
+
+    # Called from the event loop, so it must not wait on the lock that a
+    # worker holds for a whole (possibly interactive) service build.
+    _gmail_state = None
+
+
+def _build_gmail_service() -> Tuple[Resource, Credentials]:
     try:
         PROJECT_ROOT = os.path.abspath(
             os.path.join(os.path.dirname(__file__), "../../..")
@@ -79,8 +191,15 @@ def _init_gmail_service() -> Credentials:
             with open(TOKEN_PATH, "w") as token:
                 token.write(creds.to_json())
 
-        service = build("gmail", "v1", credentials=creds)
-        return service
+        service = build(
+            "gmail",
+            "v1",
+            http=_ThreadLocalAuthorizedHttp(creds),
+            cache_discovery=False,
+            static_discovery=True,
+            model=_OrjsonModel() if orjson is not None else None
+        )
+        return service, creds
 
     except Exception as error:
         logger.error("Failed to initialize Gmail", exc_info=error)
@@ -91,5 +210,8 @@ def _init_gmail_service() -> Credentials:
         ) from error
 
 
-async def async_init_gmail_service() -> Credentials:
+async def async_init_gmail_service() -> Resource:
+    if (service := _get_usable_gmail_service()) is not None:
+        return service
+
     return await asyncio.to_thread(_init_gmail_service)
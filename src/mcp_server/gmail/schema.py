@@ -12,12 +12,58 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+from textwrap import dedent
 from typing import Literal
 
 
-GMAIL_MESSAGE_FORMAT = Literal["full", "metadata", "minimal", "raw"]
+FORMAT_FULL = "full"
+FORMAT_METADATA = "metadata"
+FORMAT_MINIMAL = "minimal"
+FORMAT_RAW = "raw"
+
+MCP_INCLUDE_DESCRIPTIONS = (
+    os.environ.get("MCP_INCLUDE_DESCRIPTIONS", "1") == "1"
+)
 
-GMAIL_MCP_SERVER_INSTRUCTIONS = """
+GMAIL_MESSAGE_FORMAT = Literal["full", "metadata", "minimal", "raw"]
+GMAIL_MESSAGE_FORMATS = frozenset(
+    (FORMAT_FULL, FORMAT_METADATA, FORMAT_MINIMAL, FORMAT_RAW)
+)
+
+GMAIL_BATCH_REQUEST_LIMIT = 100
+GMAIL_BATCH_MODIFY_LIMIT = 1000
+GMAIL_CONCURRENT_SEND_LIMIT = 8
+
+GMAIL_QUERY_EXAMPLES = (
+    "is:unread, from:X, after:YYYY/MM/DD, has:attachment, label:LABEL, "
+    "newer_than:7d"
+)
+
+GMAIL_LIST_FIELDS_MASK = (
+    "messages/id,messages/threadId,nextPageToken,resultSizeEstimate"
+)
+GMAIL_LIST_IDS_FIELDS_MASK = "messages/id"
+GMAIL_LIST_DRAFTS_FIELDS_MASK = (
+    "drafts(id,message(id,threadId,labelIds,snippet)),nextPageToken,"
+    "resultSizeEstimate"
+)
+GMAIL_GET_METADATA_FIELDS_MASK = (
+    "id,threadId,labelIds,snippet,payload/headers,internalDate"
+)
+GMAIL_DRAFT_CONTENT_FIELDS_MASK = (
+    "id,message(payload(headers,body/data,parts(mimeType,body/data)))"
+)
+GMAIL_DRAFT_HEADERS_FIELDS_MASK = "id,message/payload/headers"
+GMAIL_ID_FIELDS_MASK = "id"
+
+GMAIL_NO_SUBJECT = "(No Subject)"
+GMAIL_REPLY_PREFIXES = ("re:", "Re:", "RE:", "rE:")
+
+GMAIL_PROFILE_CACHE_TTL_SECONDS = 60
+GMAIL_PROFILE_CACHE_MAX_ENTRIES = 128
+
+GMAIL_MCP_SERVER_INSTRUCTIONS = dedent("""
 # Gmail MCP Server
 
 This MCP server provides a comprehensive suite of tools for managing messages 
@@ -59,6 +105,16 @@ consistent behavior.
     list_messages(query="is:unread", max_results=5)
 2.  Retrieve the full content of a message using its ID: 
     get_message(user_id="me", message_id="message_id_from_step_1")
+3.  To read several of the listed messages, fetch them in one call: 
+    batch_get_messages(user_id="me", message_ids=["id_1", "id_2"])
+4.  Or list and read the matching messages in a single call: 
+    list_messages_with_content(user_id="me", query="is:unread")
+
+### Cleaning Up Multiple Emails
+1.  List the messages to clean up: 
+    list_messages(query="from:newsletter@example.com older_than:30d")
+2.  Trash or relabel all of them in a single call: 
+    batch_trash_messages(user_id="me", message_ids=["id_1", "id_2"])
 
 ### Sending an Existing Draft
 1.  Retrieve the draft_id with list_drafts or by name.
@@ -86,9 +142,9 @@ consistent behavior.
     that need changes to avoid overwriting existing data.
 - **Organize with Labels:** Use add_label and remove_label to categorize and 
     manage emails more effectively.
-"""
+""").strip()
 
-GET_GMAIL_PROFILE_DESCRIPTION = """
+GET_GMAIL_PROFILE_DESCRIPTION = dedent(f"""
 Retrieves the Gmail profile information for a given user. Returns the user's 
 Gmail profile details, such as email address, messages total, threads total and 
 history ID, on success, or an error message if the user ID is invalid.
@@ -96,9 +152,18 @@ history ID, on success, or an error message if the user ID is invalid.
 This tool is useful for retrieving account-level metadata before performing 
 other Gmail operations. It helps verify the mailbox identity and gives an 
 overview of the message and thread counts without accessing individual emails.
-"""
 
-LIST_GMAIL_MESSAGES_DESCRIPTION = """
+Results are cached for {GMAIL_PROFILE_CACHE_TTL_SECONDS}s per user_id and dropped 
+after any change made through this server's tools. Pass `force_refresh=True` 
+to pick up changes made elsewhere, such as in the Gmail web UI.
+""").strip()
+
+LIST_GMAIL_MESSAGES_DESCRIPTION = dedent(f"""
+ALWAYS push filters into the `query` parameter (server-side Gmail search) rather 
+than retrieving broadly and filtering afterward — this shifts work to Google's 
+index and avoids fetching messages you will discard. Common query fragments: 
+{GMAIL_QUERY_EXAMPLES}.
+
 Lists the messages in the user's Gmail mailbox using the Gmail API. By default, 
 it retrieves messages for the user. Additional filters such as a query can be 
 provided to refine the results. Returns a dictionary containing the list of 
@@ -107,10 +172,14 @@ ID, an error message is returned.
 
 This tool is useful for exploring the contents of a mailbox before fetching the
 individual message details. It helps users preview available messages without 
-retrieving full message payloads.
-"""
+retrieving full message payloads. After listing, use `batch_get_messages` (not 
+repeated `get_message`) to retrieve the contents of more than one message.
+
+Responses are requested with a `fields` partial-response mask, so only message 
+IDs, thread IDs, the next page token and the result size estimate are returned.
+""").strip()
 
-GET_EMAIL_MESSAGE_DESCRIPTION = """
+GET_EMAIL_MESSAGE_DESCRIPTION = dedent("""
 Retrieves the content of a specific Gmail message for a given user. Supports 
 various response formats such as full, metadata, minimal, and raw. Returns the 
 message details including internalDate, payload, and historyId.
@@ -118,18 +187,44 @@ message details including internalDate, payload, and historyId.
 This tool is useful for inspecting the details of a message after obtaining its 
 ID from the list_messages response. It helps users access subject lines, sender 
 information, and message body content.
-"""
 
-SEND_MESSAGE_DESCRIPTION = """
+Prefer the "metadata" format when only headers, labels or the snippet are 
+needed; it is served with a `fields` partial-response mask that omits the 
+message body and cuts the payload size substantially.
+""").strip()
+
+BATCH_GET_EMAIL_MESSAGES_DESCRIPTION = dedent("""
+Retrieves multiple Gmail messages in a single batched HTTP call (up to 100 IDs 
+per request; automatically chunked above that). Supports the same response 
+formats as get_message. Returns a dict of the retrieved messages keyed by 
+message_id.
+
+This tool is useful for reading several messages at once, such as after a 
+list_messages call. Prefer this over repeated get_message calls when more than 
+one ID is known, to collapse N HTTP round-trips into one per 100 messages.
+""").strip()
+
+LIST_MESSAGES_WITH_CONTENT_DESCRIPTION = dedent("""
+Lists the messages matching a Gmail search query and retrieves their contents 
+in the same call: one list request followed by batched get requests (up to 100 
+messages per HTTP call). Returns the messages in list order, in the requested 
+format ("metadata" by default).
+
+This tool is useful when the user wants to read what a search returns, such as 
+"summarize my unread emails". Prefer it over list_messages followed by 
+get_message or batch_get_messages, since it saves a tool round-trip.
+""").strip()
+
+SEND_MESSAGE_DESCRIPTION = dedent("""
 Sends an email on behalf of the authenticated user via their Gmail account. 
 Supports specifying sender, recipients (To, Cc, Bcc), subject and message body. 
 
 This tool is useful for automating email communication, such as sending emails,
 notifications, reports, or alerts. It allows applications to deliver messages 
 directly from a user's Gmail account without manual intervention.
-"""
+""").strip()
 
-MODIFY_MESSAGE_LABEL_DESCRIPTION = """
+MODIFY_MESSAGE_LABEL_DESCRIPTION = dedent("""
 Modifies the labels on an existing Gmail message using the Gmail API. Supports 
 adding and removing both gmail provided and custom-created labels.
 
@@ -137,9 +232,19 @@ This tool is useful for managing Gmail messages, such as organizing emails into
 categories, marking emails as read/unread, or applying/removing system and 
 custom labels. It allows applications to streamline email management tasks 
 directly from a user's Gmail account.
-"""
+""").strip()
+
+BATCH_MODIFY_LABELS_DESCRIPTION = dedent("""
+Modifies the labels on multiple Gmail messages at once using the Gmail API's 
+native batchModify endpoint, which accepts up to 1000 IDs per call. The same 
+labels are added to and removed from every message in the list.
 
-TRASH_MESSAGE_DESCRIPTION = """
+Prefer this tool over looping modify_message_labels for bulk cleanup, such as 
+marking a set of search results as read or moving them under a custom label, 
+since a single request replaces one request per message.
+""").strip()
+
+TRASH_MESSAGE_DESCRIPTION = dedent("""
 Moves a specified Gmail message to the trash. This does not permanently delete 
 the email, but rather marks it as "trashed," allowing recovery from the Trash 
 folder if needed. The Gmail API securely handles the operation.
@@ -148,9 +253,19 @@ This tool is useful for managing email workflows where certain messages should
 no longer appear in the inbox, such as archiving outdated conversations, 
 cleaning up spam, or temporarily removing clutter while retaining the option to 
 restore later.
-"""
+""").strip()
+
+BATCH_TRASH_MESSAGES_DESCRIPTION = dedent("""
+Moves multiple Gmail messages to the trash at once using the Gmail API's native 
+batchModify endpoint, which accepts up to 1000 IDs per call. Messages are not 
+permanently deleted and can still be restored from the Trash folder.
 
-UNTRASH_MESSAGE_DESCRIPTION = """
+Prefer this tool over looping trash_message for bulk cleanup, such as clearing 
+out old newsletters or notifications returned by list_messages, since a single 
+request replaces one request per message.
+""").strip()
+
+UNTRASH_MESSAGE_DESCRIPTION = dedent("""
 Restores a previously trashed Gmail message for the user. Once untrashed, the 
 message will reappear in the user's mailbox (e.g., Inbox or its original 
 folder), making it accessible again for normal use. The Gmail API securely 
@@ -160,9 +275,9 @@ This tool is useful for recovering emails that were accidentally moved to trash
 or restoring messages that need further action. It ensures that important 
 communications can be brought back into the regular mailbox workflow without 
 data loss.
-"""
+""").strip()
 
-LIST_DRAFTS_DESCRIPTION = """
+LIST_DRAFTS_DESCRIPTION = dedent("""
 Lists all drafts in the user's Gmail account. This tool retrieves a collection 
 of draft messages, including their metadata such as subject, recipients, and 
 status. It allows users to view and manage their email drafts efficiently.
@@ -170,9 +285,9 @@ status. It allows users to view and manage their email drafts efficiently.
 This tool is useful for exploring the draft messages in a user's mailbox before 
 fetching the individual draft details. It helps users preview available drafts 
 without retrieving full message payloads.
-"""
+""").strip()
 
-GET_DRAFT_DESCRIPTION = """
+GET_DRAFT_DESCRIPTION = dedent("""
 Retrieves a specific draft from the user's Gmail account. This tool allows to 
 access and manage email drafts directly, providing the ability to view, edit or 
 delete draft messages as needed.
@@ -180,9 +295,20 @@ delete draft messages as needed.
 This tool is useful for inspecting the details of a draft after obtaining its 
 ID from the `list_drafts` response. It helps users access subject lines, sender 
 information, and message body content.
-"""
+""").strip()
+
+BATCH_GET_DRAFTS_DESCRIPTION = dedent("""
+Retrieves multiple drafts from the user's Gmail account in a single batched 
+HTTP call (up to 100 IDs per request; automatically chunked above that). 
+Supports the same response formats as get_draft. Returns a dict of the drafts' 
+message objects keyed by draft_id.
+
+This tool is useful for reviewing several drafts at once, such as after a 
+`list_drafts` call. Prefer this over repeated get_draft calls when more than 
+one ID is known, to collapse N HTTP round-trips into one per 100 drafts.
+""").strip()
 
-SEND_DRAFT_DESCRIPTION = """
+SEND_DRAFT_DESCRIPTION = dedent("""
 Sends a draft email message for the user. This tool allows users to send 
 previously created drafts without needing to recreate the email content. The 
 Gmail API securely handles the sending operation.
@@ -190,31 +316,56 @@ Gmail API securely handles the sending operation.
 This tool is useful for automating email workflows where drafts are prepared 
 in advance and need to be sent at a later time. It ensures that users can 
 efficiently manage their email communications without duplicating effort.
-"""
+""").strip()
+
+BATCH_SEND_DRAFTS_DESCRIPTION = dedent("""
+Sends multiple existing drafts from the user's Gmail account. The Gmail API has 
+no batch endpoint for sending, so the drafts are sent concurrently (up to 8 at 
+a time) and the result lists the sent message IDs along with any draft IDs that 
+could not be sent.
+
+This tool is useful for delivering several prepared drafts at once. Prefer it 
+over looping send_draft when more than one draft ID is known.
+""").strip()
 
-CREATE_DRAFT_DESCRIPTION = """
+CREATE_DRAFT_DESCRIPTION = dedent("""
 Creates a new draft email message for the user. This tool allows users to 
 compose and save email drafts without sending them immediately.
 
 This tool is useful for preparing email messages in advance, allowing users 
 to refine their content before sending. It ensures that users can manage their 
 email communications efficiently without the need for immediate delivery.
-"""
+""").strip()
 
-UPDATE_DRAFT_DESCRIPTION = """
+UPDATE_DRAFT_DESCRIPTION = dedent("""
 Updates an existing draft email message for the user. This tool allows users to 
 modify the content or metadata of a draft without creating a new one. The Gmail 
 API handles the update operation securely.
 
 This tool is useful for refining email drafts after initial creation, ensuring 
 that users can make adjustments as needed before sending.
-"""
+""").strip()
 
-DELETE_DRAFT_DESCRIPTION = """
+DELETE_DRAFT_DESCRIPTION = dedent("""
 Permanently deletes a specific draft from the user's Gmail account. This tool
 immediately removes the draft message without moving it to the trash.
 
 This tool is useful for managing email drafts, allowing users to clean unwanted 
 drafts efficiently. **Use with caution, as this action cannot be undone.**
-"""
-        
\ No newline at end of file
+""").strip()
+
+BATCH_DELETE_DRAFTS_DESCRIPTION = dedent("""
+Permanently deletes multiple drafts from the user's Gmail account in a single 
+batched HTTP call (up to 100 IDs per request; automatically chunked above 
+that). The drafts are removed immediately without moving them to the trash.
+
+This tool is useful for cleaning up several unwanted drafts at once. Prefer it 
+over looping delete_draft when more than one ID is known. **Use with caution, 
+as this action cannot be undone.**
+""").strip()
+
+
+def tool_description(description: str, summary: str) -> str:
+    # An empty description makes FastMCP fall back to the (longer) docstring,
+    # so the one-line summary is sent when full descriptions are disabled.
+    return description if MCP_INCLUDE_DESCRIPTIONS else summary
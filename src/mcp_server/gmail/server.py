@@ -12,22 +12,115 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import re
-import base64
+import time
 import asyncio
 import logging
+import httplib2
 from pydantic import Field
-from email.mime.text import MIMEText
-from typing import Annotated, Any, Dict, List, Optional, Union
+from typing import Annotated, Any, Callable, Dict, List, Optional, Tuple, Union
 
 from mcp.server.fastmcp import FastMCP
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
 
 import schema
 from auth import async_init_gmail_service
-from utils import is_valid_email, handle_gmail_exceptions
+from utils import (
+    run_gmail_io,
+    validate_ids,
+    is_valid_email,
+    handle_gmail_exceptions,
+    encode_raw_message,
+    decode_message_data,
+    compose_plain_text_message,
+    partition_email_addresses,
+)
 
 logger = logging.getLogger(__name__)
 
+_profile_cache: Dict[str, Tuple[float, Dict[str, Union[str, int]]]] = {}
+
+
+def _invalidate_profile_cache() -> None:
+    # "me" and the account's address share one mailbox, so every entry goes.
+    _profile_cache.clear()
+
+
+def _merge_recipients(
+    existing: str,
+    add: Optional[List[str]],
+    remove: Optional[List[str]],
+) -> Tuple[str, List[str]]:
+    parts = existing.split(",")
+    recipients, invalid = dict.fromkeys(filter(None, map(str.strip, parts))), []
+
+    for email in add or []:
+        if is_valid_email(email):
+            recipients[email] = None
+        else:
+            invalid.append(email)
+
+    for email in remove or []:
+        if is_valid_email(email):
+            recipients.pop(email, None)
+        else:
+            invalid.append(email)
+
+    return ", ".join(recipients), invalid
+
+
+async def _execute_batched(
+    service: Any,
+    ids: List[str],
+    build_request: Callable[[str], HttpRequest],
+) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+    results, failed_ids = {}, []
+
+    def collect_response(request_id, response, exception):
+        if exception is None:
+            results[request_id] = response
+        else:
+            failed_ids.append(request_id)
+
+    batch_size = schema.GMAIL_BATCH_REQUEST_LIMIT
+
+    for start in range(0, len(ids), batch_size):
+        chunk = ids[start:start + batch_size]
+        batch = service.new_batch_http_request(callback=collect_response)
+
+        for request_id in chunk:
+            batch.add(build_request(request_id), request_id=request_id)
+
+        try:
+            await run_gmail_io(batch.execute)
+
+        except (HttpError, OSError, httplib2.HttpLib2Error) as error:
+            # Auth, permission and quota errors would only repeat (or worsen)
+            # when fanned out per request, so those are left to the caller.
+            if isinstance(error, HttpError) and error.resp.status < 500:
+                raise
+
+            logger.warning(
+                "Batch request failed, retrying individually", exc_info=error
+            )
+
+            responses = await asyncio.gather(
+                *(
+                    run_gmail_io(build_request(request_id).execute)
+                    for request_id in chunk
+                ),
+                return_exceptions=True
+            )
+
+            for request_id, response in zip(chunk, responses):
+                collect_response(
+                    request_id,
+                    response,
+                    response if isinstance(response, Exception) else None
+                )
+
+    return results, failed_ids
+
 
 mcp = FastMCP(
     "Gmail MCP Server",
@@ -44,27 +137,41 @@ mcp = FastMCP(
 
 @mcp.tool(
     title="Get Profile",
-    description=schema.GET_GMAIL_PROFILE_DESCRIPTION
+    description=schema.tool_description(
+        schema.GET_GMAIL_PROFILE_DESCRIPTION,
+        "Gets the Gmail profile of a user."
+    )
 )
+@validate_ids()
 @handle_gmail_exceptions
 async def get_profile(
     user_id: Annotated[
         str,
         Field(description="User's email id. Use 'me' for authenticated users.")
     ],
+    force_refresh: Annotated[
+        Optional[bool],
+        Field(description="Whether to bypass the cached profile information.")
+    ] = None,
 ) -> Dict[str, Union[str, Dict[str, Union[str, int]]]]:
     """
     Tool to retrieve the Gmail profile of a user.
 
     This tool fetches the profile details for a specified user using the Gmail
     API. If the special identifier 'me' is used, the profile of the 
-    authenticated user is retrieved.
+    authenticated user is retrieved. Profiles are cached per user_id for 
+    `GMAIL_PROFILE_CACHE_TTL_SECONDS`, unless force_refresh is set, and the 
+    cache is cleared whenever a tool sends, trashes or relabels messages, or 
+    creates, updates or deletes drafts.
 
     Args:
         user_id (str): User ID of the profile to be retrieved.
             - Use "me" to fetch the profile of the authenticated user.
             - Must be a valid email format if not "me".
             - Example: "user@example.com"
+        force_refresh (Optional[bool]): Whether to skip the cached profile 
+            and fetch fresh counts from the Gmail API.
+            - Example: True
 
     Returns:
         Dict[str, Union[str, Dict[str, Union[str, int]]]]: A dict containing:
@@ -97,23 +204,21 @@ async def get_profile(
                 }
             }
     """
-    if not user_id or not user_id.strip():
-        return {
-            "status": "error", 
-            "message": "User Id cannot be empty."
-        }
+    cached = _profile_cache.pop(user_id, None)
+
+    if cached and not force_refresh and cached[0] > time.monotonic():
+        _profile_cache[user_id] = cached
 
-    if user_id != "me" and not is_valid_email(user_id):
         return {
-            "status": "error", 
-            "message": "Invalid User Id format."
+            "status": "success", 
+            "profile_information": cached[1]
         }
 
     service = await async_init_gmail_service()
 
-    response = await asyncio.to_thread(
-        lambda: service.users().getProfile(userId=user_id).execute()
-    )
+    request = service.users().getProfile(userId=user_id)
+
+    response = await run_gmail_io(request.execute)
 
     if not response:
         return {
@@ -121,6 +226,13 @@ async def get_profile(
             "message": f"Profile not found for user with id: `{user_id}`."
         }
 
+    if len(_profile_cache) >= schema.GMAIL_PROFILE_CACHE_MAX_ENTRIES:
+        _profile_cache.pop(next(iter(_profile_cache)))
+
+    _profile_cache[user_id] = (
+        time.monotonic() + schema.GMAIL_PROFILE_CACHE_TTL_SECONDS, response
+    )
+
     return {
         "status": "success", 
         "profile_information": response
@@ -129,8 +241,12 @@ async def get_profile(
 
 @mcp.tool(
     title="List Messages",
-    description=schema.LIST_GMAIL_MESSAGES_DESCRIPTION
+    description=schema.tool_description(
+        schema.LIST_GMAIL_MESSAGES_DESCRIPTION,
+        "Lists message ids matching a Gmail search query."
+    )
 )
+@validate_ids()
 @handle_gmail_exceptions
 async def list_messages(
     user_id: Annotated[
@@ -148,7 +264,11 @@ async def list_messages(
     include_spam_and_trash: Annotated[
         Optional[bool],
         Field(description="Whether to include messages from spam and trash.")
-    ] = None
+    ] = None,
+    fields: Annotated[
+        Optional[str],
+        Field(description="Partial response mask of the fields to return.")
+    ] = None,
 ) -> Dict[str, Union[str, List[Dict[str, str]]]]:
     """
     Tool to list id and threadId of email messages from a user's gmail account.
@@ -171,6 +291,9 @@ async def list_messages(
         include_spam_and_trash (Optional[bool]): Whether to include messages 
             from `SPAM` and `TRASH` in the results.
             - Example: True
+        fields (Optional[str]): Gmail API partial response mask to apply.
+            - Defaults to message ids, thread ids and the next page token.
+            - Example: "messages/id,nextPageToken"
 
     Returns:
         Dict[str, Union[str, List[Dict[str, str]]]]: A dictionary containing:
@@ -205,33 +328,22 @@ async def list_messages(
                 ]
             }
     """
-    if not user_id or not user_id.strip():
-        return {
-            "status": "error", 
-            "message": "User Id cannot be empty."
-        }
-
-    if user_id != "me" and not is_valid_email(user_id):
-        return {
-            "status": "error", 
-            "message": "Invalid User Id format."
-        }
-
-    query = str(query).strip() or None if query is not None else None
+    query = (query and query.strip()) or None
     max_results = max_results if max_results else 5
 
     service = await async_init_gmail_service()
 
-    response = await asyncio.to_thread(
-        lambda: service.users().messages().list(
-            userId=user_id,
-            q=query,
-            maxResults=max_results,
-            includeSpamTrash=include_spam_and_trash,
-        ).execute()
+    request = service.users().messages().list(
+        userId=user_id,
+        q=query,
+        maxResults=max_results,
+        includeSpamTrash=include_spam_and_trash,
+        fields=fields or schema.GMAIL_LIST_FIELDS_MASK,
     )
 
-    messages = response.get("messages", [])
+    response = await run_gmail_io(request.execute)
+
+    messages = response.get("messages")
 
     if not messages:
         return {
@@ -247,8 +359,12 @@ async def list_messages(
 
 @mcp.tool(
     title="Get Message",
-    description=schema.GET_EMAIL_MESSAGE_DESCRIPTION
+    description=schema.tool_description(
+        schema.GET_EMAIL_MESSAGE_DESCRIPTION,
+        "Gets a Gmail message by id."
+    )
 )
+@validate_ids(message_id="Message Id")
 @handle_gmail_exceptions
 async def get_message(
     user_id: Annotated[
@@ -263,6 +379,10 @@ async def get_message(
         Optional[schema.GMAIL_MESSAGE_FORMAT],
         Field(description="Format to return the message in.")
     ] = None,
+    fields: Annotated[
+        Optional[str],
+        Field(description="Partial response mask of the fields to return.")
+    ] = None,
 ) -> Dict[str, Union[str, Dict[str, Any]]]:
     """
     Tool to retrieve a specific Gmail message from the user's gmail account.
@@ -282,6 +402,9 @@ async def get_message(
             - Possible values are "full", "metadata", "minimal" and "raw". 
             - Defaults to "full", if not provided.
             - Example: "metadata"
+        fields (Optional[str]): Gmail API partial response mask to apply.
+            - Overrides the default mask used for the "metadata" format.
+            - Example: "id,labelIds,payload/headers"
 
     Returns:
         Dict[str, Union[str, Dict[str, Any]]]: A dictionary containing:
@@ -312,36 +435,28 @@ async def get_message(
                 }
             }
     """
-    if not user_id or not user_id.strip():
-        return {
-            "status": "error", 
-            "message": "User Id cannot be empty."
-        }
+    message_format = message_format if message_format else schema.FORMAT_FULL
 
-    if user_id != "me" and not is_valid_email(user_id):
+    if message_format not in schema.GMAIL_MESSAGE_FORMATS:
         return {
-            "status": "error", 
-            "message": "Invalid User Id format."
+            "status": "error",
+            "message": f"Invalid message format: {message_format}."
         }
 
-    if not message_id or not message_id.strip():
-        return {
-            "status": "error", 
-            "message": "Message Id cannot be empty."
-        }
-    
-    message_format = message_format if message_format else "full"
+    if not fields and message_format == schema.FORMAT_METADATA:
+        fields = schema.GMAIL_GET_METADATA_FIELDS_MASK
 
     service = await async_init_gmail_service()
 
-    message = await asyncio.to_thread(
-        lambda: service.users().messages().get(
-            userId=user_id, 
-            id=message_id, 
-            format=message_format
-        ).execute()
+    request = service.users().messages().get(
+        userId=user_id, 
+        id=message_id, 
+        format=message_format,
+        fields=fields
     )
 
+    message = await run_gmail_io(request.execute)
+
     if not message:
         return {
             "status": "not_found", 
@@ -354,10 +469,306 @@ async def get_message(
     }
 
 
+@mcp.tool(
+    title="Batch Get Messages",
+    description=schema.tool_description(
+        schema.BATCH_GET_EMAIL_MESSAGES_DESCRIPTION,
+        "Gets multiple Gmail messages by id."
+    )
+)
+@validate_ids()
+@handle_gmail_exceptions
+async def batch_get_messages(
+    user_id: Annotated[
+        str,
+        Field(description="User's email id. Use 'me' for authenticated users.")
+    ],
+    message_ids: Annotated[
+        List[str],
+        Field(description="Unique IDs of the Gmail messages to retrieve.")
+    ],
+    message_format: Annotated[
+        Optional[schema.GMAIL_MESSAGE_FORMAT],
+        Field(description="Format to return the messages in.")
+    ] = None,
+    fields: Annotated[
+        Optional[str],
+        Field(description="Partial response mask of the fields to return.")
+    ] = None,
+) -> Dict[str, Union[str, Dict[str, Dict[str, Any]]]]:
+    """
+    Tool to retrieve multiple Gmail messages from the user's gmail account.
+
+    This tool fetches the details of several Gmail messages using the Gmail
+    API's batch endpoint, so up to 100 messages are retrieved in a single HTTP
+    round-trip. Larger lists of IDs are split into chunks of 100 messages.
+
+    Args:
+        user_id (str): Email ID of the user whose messages are retrieved.
+            - Use "me" to fetch the messages of the authenticated user.
+            - Must be a valid email format if not "me".
+            - Example: "user@example.com"
+        message_ids (List[str]): Unique IDs of the Gmail messages to retrieve.
+            - Example: ["1234abcd9876wxyz", "198b7b6ecb1debad"]
+        message_format (Optional[str]): The format to return the messages in.
+            - Possible values are "full", "metadata", "minimal" and "raw".
+            - Defaults to "full", if not provided.
+            - Example: "metadata"
+        fields (Optional[str]): Gmail API partial response mask to apply.
+            - Overrides the default mask used for the "metadata" format.
+            - Example: "id,labelIds,payload/headers"
+
+    Returns:
+        Dict[str, Union[str, Dict[str, Dict[str, Any]]]]: A dictionary with:
+            - 'status' (str): "success", "not_found" or "error"
+            On success:
+            - 'email_messages' (Dict[str, Dict[str, Any]]): Email message
+               resources keyed by their message id.
+            - 'failed_message_ids' (list, optional): IDs of messages that 
+               could not be retrieved, if any.
+            If not_found:
+            - 'message' (str): Message indicating no email message was found.
+            On failure:
+            - 'message' (str): Description of the error.
+
+    Example:
+        Sample Input:
+            batch_get_messages(
+                user_id="me",
+                message_ids=["198b7fcea60dacd4", "198b7b6ecb1debad"],
+                message_format="metadata"
+            )
+
+        Expected Output:
+            {
+                "status": "success",
+                "email_messages": {
+                    "198b7fcea60dacd4": {
+                        id: "198b7fcea60dacd4",
+                        threadId: "198b7fcea60dacd4",
+                        labelIds: ["INBOX"],
+                        snippet: "Hey, just checking in on the report due...",
+                        payload: { ... }
+                    },
+                    "198b7b6ecb1debad": { ... }
+                }
+            }
+    """
+    message_ids = list(dict.fromkeys(
+        message_id.strip() for message_id in message_ids or []
+        if message_id and message_id.strip()
+    ))
+
+    if not message_ids:
+        return {
+            "status": "error",
+            "message": "Message Ids cannot be empty."
+        }
+
+    message_format = message_format if message_format else schema.FORMAT_FULL
+
+    if message_format not in schema.GMAIL_MESSAGE_FORMATS:
+        return {
+            "status": "error",
+            "message": f"Invalid message format: {message_format}."
+        }
+
+    if not fields and message_format == schema.FORMAT_METADATA:
+        fields = schema.GMAIL_GET_METADATA_FIELDS_MASK
+
+    service = await async_init_gmail_service()
+
+    email_messages, failed_message_ids = await _execute_batched(
+        service,
+        message_ids,
+        lambda message_id: service.users().messages().get(
+            userId=user_id,
+            id=message_id,
+            format=message_format,
+            fields=fields
+        )
+    )
+
+    if not email_messages:
+        return {
+            "status": "not_found",
+            "message": f"No messages found for the given ids for {user_id}."
+        }
+
+    result = {
+        "status": "success",
+        "email_messages": email_messages
+    }
+
+    if failed_message_ids:
+        result["failed_message_ids"] = failed_message_ids
+
+    return result
+
+
+@mcp.tool(
+    title="List Messages With Content",
+    description=schema.tool_description(
+        schema.LIST_MESSAGES_WITH_CONTENT_DESCRIPTION,
+        "Lists and gets messages matching a Gmail search query."
+    )
+)
+@validate_ids()
+@handle_gmail_exceptions
+async def list_messages_with_content(
+    user_id: Annotated[
+        str,
+        Field(description="User's email id. Use 'me' for authenticated users.")
+    ],
+    query: Annotated[
+        Optional[str],
+        Field(description="Free text search terms to filter messages by.")
+    ] = None,
+    max_results: Annotated[
+        Optional[int],
+        Field(description="Maximum number of messages to return", ge=1, le=100)
+    ] = None,
+    include_spam_and_trash: Annotated[
+        Optional[bool],
+        Field(description="Whether to include messages from spam and trash.")
+    ] = None,
+    message_format: Annotated[
+        Optional[schema.GMAIL_MESSAGE_FORMAT],
+        Field(description="Format to return the messages in.")
+    ] = None,
+) -> Dict[str, Union[str, List[Dict[str, Any]]]]:
+    """
+    Tool to list email messages and retrieve their contents in a single call.
+
+    This tool lists the messages matching the given filters and then fetches 
+    all of them through the Gmail API's batch endpoint, so N messages cost one 
+    list request plus one HTTP round-trip per 100 messages, instead of N + 1.
+
+    Args:
+        user_id (str): User ID or email address.
+            - Use "me" to fetch messages for the authenticated user.
+            - Must be a valid email format if not "me".
+            - Example: "user@example.com"
+        query (Optional[str]): Only return messages matching specified query.
+            - Supports the same query format as Gmail's search box.
+            - Example: 'from:user@example.com is:unread'
+        max_results (Optional[int]): Maximum number of messages to return.
+            - Value must be between 1 to 100. Defaults to 5, if not provided.
+            - Example: 10
+        include_spam_and_trash (Optional[bool]): Whether to include messages 
+            from `SPAM` and `TRASH` in the results.
+            - Example: True
+        message_format (Optional[str]): The format to return the messages in.
+            - Possible values are "full", "metadata", "minimal" and "raw".
+            - Defaults to "metadata", if not provided.
+            - Example: "full"
+
+    Returns:
+        Dict[str, Union[str, List[Dict[str, Any]]]]: A dictionary containing:
+            - 'status' (str): "success", "not_found" or "error"
+            On success:
+            - 'email_messages' (List[Dict]): Message resources in list order.
+            - 'failed_message_ids' (list, optional): IDs of listed messages 
+               that could not be retrieved, if any.
+            If not_found:
+            - 'message' (str): Message indicating no email messages were found.
+            On failure:
+            - 'message' (str): Description of the error.
+
+    Example:
+        Sample Input:
+            list_messages_with_content(
+                user_id="me",
+                query="is:unread",
+                max_results=2
+            )
+
+        Expected Output:
+            {
+                "status": "success",
+                "email_messages": [
+                    {
+                        id: "198b7fcea60dacd4",
+                        threadId: "198b7fcea60dacd4",
+                        labelIds: ["INBOX", "UNREAD"],
+                        snippet: "Hey, just checking in on the report due...",
+                        payload: { ... }
+                    },
+                    { ... }
+                ]
+            }
+    """
+    query = (query and query.strip()) or None
+    max_results = max_results if max_results else 5
+
+    message_format = (
+        message_format if message_format else schema.FORMAT_METADATA
+    )
+
+    if message_format not in schema.GMAIL_MESSAGE_FORMATS:
+        return {
+            "status": "error",
+            "message": f"Invalid message format: {message_format}."
+        }
+
+    fields = (
+        schema.GMAIL_GET_METADATA_FIELDS_MASK
+        if message_format == schema.FORMAT_METADATA else None
+    )
+
+    service = await async_init_gmail_service()
+
+    request = service.users().messages().list(
+        userId=user_id,
+        q=query,
+        maxResults=max_results,
+        includeSpamTrash=include_spam_and_trash,
+        fields=schema.GMAIL_LIST_IDS_FIELDS_MASK
+    )
+
+    response = await run_gmail_io(request.execute)
+
+    message_ids = [message["id"] for message in response.get("messages", ())]
+
+    if not message_ids:
+        return {
+            "status": "not_found", 
+            "message": f"No messages found for user with id: '{user_id}'"
+        }
+
+    email_messages, failed_message_ids = await _execute_batched(
+        service,
+        message_ids,
+        lambda message_id: service.users().messages().get(
+            userId=user_id,
+            id=message_id,
+            format=message_format,
+            fields=fields
+        )
+    )
+
+    result = {
+        "status": "success",
+        "email_messages": [
+            email_messages[message_id]
+            for message_id in message_ids if message_id in email_messages
+        ]
+    }
+
+    if failed_message_ids:
+        result["failed_message_ids"] = failed_message_ids
+
+    return result
+
+
 @mcp.tool(
     title="Send Message",
-    description=schema.SEND_MESSAGE_DESCRIPTION
+    description=schema.tool_description(
+        schema.SEND_MESSAGE_DESCRIPTION,
+        "Sends an email from the user's Gmail account."
+    )
 )
+@validate_ids()
 @handle_gmail_exceptions
 async def send_message(
     user_id: Annotated[
@@ -452,86 +863,63 @@ async def send_message(
                 }
             }
     """
-    if not user_id or not user_id.strip():
+    if not to or not to.strip():
         return {
-            "status": "error", 
-            "message": "User Id cannot be empty."
+            "status": "error",
+            "message": "Recipient email id cannot be empty."
         }
 
-    if user_id != "me" and not is_valid_email(user_id):
+    valid_to, invalid_to = partition_email_addresses(to)
+
+    if invalid_to:
         return {
             "status": "error", 
-            "message": "Invalid User Id format."
+            "message": f"Invalid recipient email address: {invalid_to[0]}."
         }
 
-    if not to or not to.strip():
+    if not valid_to:
         return {
             "status": "error",
             "message": "Recipient email id cannot be empty."
         }
 
-    to = re.sub(r"[\(\)\[\]\{\}\<\>]", "", to)
-
-    valid_to = []
-
-    for email in re.split(r",\s*", to):
-        if not is_valid_email(email.strip()):
-            return {
-                "status": "error", 
-                "message": f"Invalid recipient email address: {email.strip()}."
-            }
-
-        else:
-            valid_to.append(email)
-
     to = ", ".join(valid_to)
 
-    subject = "(No Subject)" if not subject or not subject.strip() else subject
+    if not subject or not subject.strip():
+        subject = schema.GMAIL_NO_SUBJECT
 
-    if in_reply_to and not subject.lower().startswith('re:'):
+    if in_reply_to and not subject.startswith(schema.GMAIL_REPLY_PREFIXES):
         subject = f"Re: {subject}"
 
-    message = MIMEText(body or "")
+    headers = [("to", to)]
 
-    message['to'] = to
-    message["from"] = user_id if user_id != "me" else "me"
-    message['subject'] = subject
+    if user_id != "me":
+        headers.append(("from", user_id))
 
-    valid_cc = []
-    invalid_cc_email = []
+    headers.append(("subject", subject))
 
-    if cc:
-        cc = re.sub(r"[\(\)\[\]\{\}\<\>]", "", cc)
+    invalid_cc_email, invalid_bcc_email = [], []
 
-        for email in re.split(r",\s*", cc):
-            if not is_valid_email(email.strip()):
-                invalid_cc_email.append(email.strip())
-            else:
-                valid_cc.append(email)
+    if cc or bcc or in_reply_to:
+        valid_cc, invalid_cc_email = partition_email_addresses(cc or "")
 
         if valid_cc:
-            message['cc'] = ", ".join(valid_cc)
+            headers.append(("cc", ", ".join(valid_cc)))
 
-    valid_bcc = []
-    invalid_bcc_email = []
+        valid_bcc, invalid_bcc_email = partition_email_addresses(bcc or "")
 
-    if bcc:
-        bcc = re.sub(r"[\(\)\[\]\{\}\<\>]", "", bcc)
+        if valid_bcc:
+            headers.append(("bcc", ", ".join(valid_bcc)))
 
-        for email in re.split(r",\s*", bcc):
-            if not is_valid_email(email.strip()):
-                invalid_bcc_email.append(email.strip())
-            else:
-                valid_bcc.append(email)
+        if in_reply_to:
+            headers.append(("In-Reply-To", in_reply_to))
+            headers.append(("References", in_reply_to))
 
-        if valid_bcc:
-            message['bcc'] = ", ".join(valid_bcc)
-
-    if in_reply_to:
-        message['In-Reply-To'] = in_reply_to
-        message['References'] = in_reply_to
-
-    raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
+    raw_message = await asyncio.to_thread(
+        lambda: encode_raw_message(
+            compose_plain_text_message(headers, body or "")
+        )
+    )
 
     message_payload = {
         "raw": raw_message
@@ -542,18 +930,24 @@ async def send_message(
 
     service = await async_init_gmail_service()
 
-    response = await asyncio.to_thread(
-        lambda: service.users().messages().send(
-            userId=user_id, 
-            body=message_payload
-        ).execute()
+    request = service.users().messages().send(
+        userId=user_id, 
+        body=message_payload,
+        fields=schema.GMAIL_ID_FIELDS_MASK
     )
 
+    response = await run_gmail_io(request.execute)
+
+    _invalidate_profile_cache()
+
     result = {
         "status": "success", 
         "message": f"Email delivered with id: {response.get('id')}"
     }
 
+    if not (invalid_cc_email or invalid_bcc_email):
+        return result
+
     warnings = []
 
     if invalid_cc_email:
@@ -574,8 +968,12 @@ async def send_message(
 
 @mcp.tool(
     title="Modify Message Labels",
-    description=schema.MODIFY_MESSAGE_LABEL_DESCRIPTION
+    description=schema.tool_description(
+        schema.MODIFY_MESSAGE_LABEL_DESCRIPTION,
+        "Adds or removes labels on a Gmail message."
+    )
 )
+@validate_ids(message_id="Message Id")
 @handle_gmail_exceptions
 async def modify_message_labels(
     user_id: Annotated[
@@ -637,22 +1035,115 @@ async def modify_message_labels(
                 "message": "Labels modified for message id: sample-message-id"
             }
     """
-    if not user_id or not user_id.strip():
-        return {
-            "status": "error", 
-            "message": "User Id cannot be empty."
-        }
+    body = {}
+
+    if add_labels:
+        body["addLabelIds"] = add_labels
+
+    if remove_labels:
+        body["removeLabelIds"] = remove_labels
 
-    if user_id != "me" and not is_valid_email(user_id):
+    if not body:
         return {
             "status": "error", 
-            "message": "Invalid User Id format."
+            "message": "No labels provided to modify."
         }
 
-    if not message_id or not message_id.strip():
+    service = await async_init_gmail_service()
+
+    request = service.users().messages().modify(
+        userId=user_id,
+        id=message_id,
+        body=body
+    )
+
+    await run_gmail_io(request.execute)
+
+    _invalidate_profile_cache()
+
+    return {
+        "status": "success",
+        "message": f"Labels modified for message id: {message_id}."
+    }
+
+
+@mcp.tool(
+    title="Batch Modify Message Labels",
+    description=schema.tool_description(
+        schema.BATCH_MODIFY_LABELS_DESCRIPTION,
+        "Adds or removes labels on multiple Gmail messages."
+    )
+)
+@validate_ids()
+@handle_gmail_exceptions
+async def batch_modify_message_labels(
+    user_id: Annotated[
+        str,
+        Field(description="User's email id. Use 'me' for authenticated users.")
+    ],
+    message_ids: Annotated[
+        List[str],
+        Field(description="Unique IDs of the Gmail messages to modify.")
+    ],
+    add_labels: Annotated[
+        Optional[List[str]],
+        Field(description="List of label IDs to add to the messages.")
+    ] = None,
+    remove_labels: Annotated[
+        Optional[List[str]],
+        Field(description="List of label IDs to remove from the messages.")
+    ] = None
+) -> Dict[str, str]:
+    """
+    Tool to modify labels of multiple Gmail messages.
+
+    This tool updates the labels assigned to several Gmail messages at once by 
+    adding new labels, removing existing ones, or both. It uses the Gmail API's 
+    batchModify endpoint, sending up to 1000 message IDs per request.
+
+    Args:
+        user_id (str): The user's email address.
+            - Use "me" to refer to the authenticated user's account.
+            - Must be a valid email format if not "me".
+            - Example: "me"
+        message_ids (List[str]): Unique IDs of the Gmail messages to update.
+            - Example: ["1234abcd9876wxyz", "198b7b6ecb1debad"]
+        add_labels (Optional[List[str]]): List of label IDs to add.
+            - Example: ["STARRED", "CUSTOM_LABEL"]
+        remove_labels (Optional[List[str]]): List of label IDs to remove.
+            - Example: ["UNREAD", "INBOX"]
+
+    Returns:
+        Dict[str, str]: A dictionary containing:
+            - 'status' (str): "success" or "error"
+            On success:
+            - 'message' (str): Confirmation message.
+            On failure:
+            - 'message' (str): Description of the error.
+    
+    Example:
+        Sample Input:
+            batch_modify_message_labels(
+                user_id="me",
+                message_ids=["198b7fcea60dacd4", "198b7b6ecb1debad"],
+                remove_labels=["UNREAD"]
+            )
+
+        Expected Output:
+            {
+                "status": "success",
+                "message": "Labels modified for 2 messages."
+            }
+    """
+    message_ids = list(dict.fromkeys(
+        message_id.strip() for message_id in message_ids or []
+        if message_id and message_id.strip()
+    ))
+
+    if not message_ids:
         return {
             "status": "error", 
-            "message": "Message Id cannot be empty."
+            "message": "Message Ids cannot be empty."
         }
 
     body = {}
@@ -671,24 +1162,32 @@ async def modify_message_labels(
 
     service = await async_init_gmail_service()
 
-    await asyncio.to_thread(
-        lambda: service.users().messages().modify(
-            userId=user_id,
-            id=message_id,
-            body=body
-        ).execute()
-    )
+    batch_size = schema.GMAIL_BATCH_MODIFY_LIMIT
+
+    for start in range(0, len(message_ids), batch_size):
+        await run_gmail_io(
+            service.users().messages().batchModify(
+                userId=user_id,
+                body={**body, "ids": message_ids[start:start + batch_size]}
+            ).execute
+        )
+
+    _invalidate_profile_cache()
 
     return {
         "status": "success",
-        "message": f"Labels modified for message id: {message_id}."
+        "message": f"Labels modified for {len(message_ids)} messages."
     }
 
 
 @mcp.tool(
     title="Trash Message",
-    description=schema.TRASH_MESSAGE_DESCRIPTION
+    description=schema.tool_description(
+        schema.TRASH_MESSAGE_DESCRIPTION,
+        "Moves a Gmail message to the trash."
+    )
 )
+@validate_ids(message_id="Message Id")
 @handle_gmail_exceptions
 async def trash_message(
     user_id: Annotated[
@@ -733,43 +1232,121 @@ async def trash_message(
                 "message": "Message with id: `abcd1234` has been trashed."
             }
     """
-    if not user_id or not user_id.strip():
-        return {
-            "status": "error", 
-            "message": "User Id cannot be empty."
-        }
+    service = await async_init_gmail_service()
 
-    if user_id != "me" and not is_valid_email(user_id):
-        return {
-            "status": "error", 
-            "message": "Invalid User Id format."
-        }
+    request = service.users().messages().trash(
+        userId=user_id,
+        id=message_id
+    )
+
+    await run_gmail_io(request.execute)
+
+    _invalidate_profile_cache()
+
+    return {
+        "status": "success",
+        "message": f"Message with id: `{message_id}` has been trashed."
+    }
+
+
+@mcp.tool(
+    title="Batch Trash Messages",
+    description=schema.tool_description(
+        schema.BATCH_TRASH_MESSAGES_DESCRIPTION,
+        "Moves multiple Gmail messages to the trash."
+    )
+)
+@validate_ids()
+@handle_gmail_exceptions
+async def batch_trash_messages(
+    user_id: Annotated[
+        str,
+        Field(description="User's email id. Use 'me' for authenticated users.")
+    ],
+    message_ids: Annotated[
+        List[str],
+        Field(description="Unique IDs of the Gmail messages to trash.")
+    ]
+) -> Dict[str, str]:
+    """
+    Tool to move multiple gmail messages to the trash folder.
+
+    This tool moves several messages to the trashed folder at once by applying 
+    the `TRASH` label through the Gmail API's batchModify endpoint, sending up 
+    to 1000 message IDs per request. Trashed messages remain in the user's 
+    account until they are either permanently deleted or restored by the user.
+
+    Args:
+        user_id (str): The user's email address.
+            - Use "me" to refer to the authenticated user's account.
+            - Must be a valid email format if not "me".
+            - Example: "me" or "user@example.com"
+        message_ids (List[str]): Unique IDs of the Gmail messages to trash.
+            - Example: ["17c693d97f54a2b5", "198b7b6ecb1debad"]
+
+    Returns:
+        Dict[str, str]: A dictionary containing:
+            - 'status' (str): "success" or "error"
+            On success:
+            - 'message' (str): Confirmation message.
+            On failure:
+            - 'message' (str): Description of the error.
+
+    Example:
+        Sample Input:
+            batch_trash_messages(
+                user_id="me", 
+                message_ids=["abcd1234", "efgh5678"]
+            )
 
-    if not message_id or not message_id.strip():
+        Expected Output:
+            {
+                "status": "success",
+                "message": "2 messages have been trashed."
+            }
+    """
+    message_ids = list(dict.fromkeys(
+        message_id.strip() for message_id in message_ids or []
+        if message_id and message_id.strip()
+    ))
+
+    if not message_ids:
         return {
             "status": "error", 
-            "message": "Message Id cannot be empty."
+            "message": "Message Ids cannot be empty."
         }
-    
+
     service = await async_init_gmail_service()
 
-    await asyncio.to_thread(
-        lambda: service.users().messages().trash(
-            userId=user_id,
-            id=message_id
-        ).execute()
-    )
+    batch_size = schema.GMAIL_BATCH_MODIFY_LIMIT
+
+    for start in range(0, len(message_ids), batch_size):
+        await run_gmail_io(
+            service.users().messages().batchModify(
+                userId=user_id,
+                body={
+                    "ids": message_ids[start:start + batch_size],
+                    "addLabelIds": ["TRASH"]
+                }
+            ).execute
+        )
+
+    _invalidate_profile_cache()
 
     return {
         "status": "success",
-        "message": f"Message with id: `{message_id}` has been trashed."
+        "message": f"{len(message_ids)} messages have been trashed."
     }
 
 
 @mcp.tool(
     title="Untrash Message",
-    description=schema.UNTRASH_MESSAGE_DESCRIPTION
+    description=schema.tool_description(
+        schema.UNTRASH_MESSAGE_DESCRIPTION,
+        "Restores a Gmail message from the trash."
+    )
 )
+@validate_ids(message_id="Message Id")
 @handle_gmail_exceptions
 async def untrash_message(
     user_id: Annotated[
@@ -817,33 +1394,17 @@ async def untrash_message(
                 "message": "Message with id: `abcd1234` has been recovered."
             }
     """
-    if not user_id or not user_id.strip():
-        return {
-            "status": "error", 
-            "message": "User Id cannot be empty."
-        }
-
-    if user_id != "me" and not is_valid_email(user_id):
-        return {
-            "status": "error", 
-            "message": "Invalid User Id format."
-        }
-
-    if not message_id or not message_id.strip():
-        return {
-            "status": "error", 
-            "message": "Message Id cannot be empty."
-        }
-
     service = await async_init_gmail_service()
 
-    await asyncio.to_thread(
-        lambda: service.users().messages().untrash(
-            userId=user_id,
-            id=message_id
-        ).execute()
+    request = service.users().messages().untrash(
+        userId=user_id,
+        id=message_id
     )
 
+    await run_gmail_io(request.execute)
+
+    _invalidate_profile_cache()
+
     return {
         "status": "success",
         "message": f"Message with id: `{message_id}` has been recovered."
@@ -852,8 +1413,12 @@ async def untrash_message(
 
 @mcp.tool(
     title="List Drafts",
-    description=schema.LIST_DRAFTS_DESCRIPTION
+    description=schema.tool_description(
+        schema.LIST_DRAFTS_DESCRIPTION,
+        "Lists drafts in the user's Gmail account."
+    )
 )
+@validate_ids()
 @handle_gmail_exceptions
 async def list_drafts(
     user_id: Annotated[
@@ -929,108 +1494,203 @@ async def list_drafts(
                 ]
             }
     """
-    if not user_id or not user_id.strip():
+    query = (query and query.strip()) or None
+    max_results = max_results if max_results else 5
+
+    service = await async_init_gmail_service()
+
+    request = service.users().drafts().list(
+        userId=user_id,
+        q=query,
+        maxResults=max_results,
+        includeSpamTrash=include_spam_and_trash,
+        fields=schema.GMAIL_LIST_DRAFTS_FIELDS_MASK
+    )
+
+    results = await run_gmail_io(request.execute)
+
+    drafts = results.get("drafts")
+
+    if not drafts:
         return {
-            "status": "error", 
-            "message": "User Id cannot be empty."
+            "status": "not_found",
+            "message": "No drafts found in user's gmail account."
         }
 
-    if user_id != "me" and not is_valid_email(user_id):
-        return {
-            "status": "error", 
-            "message": "Invalid User Id format."
+    draft_list = [
+        {
+            "draft_id": draft.get("id"),
+            "message_id": (message := draft.get("message") or {}).get("id"),
+            "thread_id": message.get("threadId"),
+            "label_ids": message.get("labelIds", ()),
+            "snippet": message.get("snippet")
         }
+        for draft in drafts
+    ]
 
-    query = str(query).strip() or None if query is not None else None
-    max_results = max_results if max_results else 5
+    return {
+        "status": "success", 
+        "drafts": draft_list
+    }
+
+
+@mcp.tool(
+    title="Get Draft",
+    description=schema.tool_description(
+        schema.GET_DRAFT_DESCRIPTION,
+        "Gets a Gmail draft by id."
+    )
+)
+@validate_ids(draft_id="Draft Id")
+@handle_gmail_exceptions
+async def get_draft(
+    user_id: Annotated[
+        str,
+        Field(description="User's email id. Use 'me' for authenticated users.")
+    ],
+    draft_id: Annotated[
+        str,
+        Field(description="ID of the draft to retrieve.")
+    ],
+    draft_format: Annotated[
+        Optional[schema.GMAIL_MESSAGE_FORMAT],
+        Field(description="Format to return the draft in.")
+    ] = None,
+) -> Dict[str, Union[str, Dict[str, Any]]]:
+    """
+    Tool to retrieve a specific draft from a user's Gmail account.
+
+    This tool fetches a draft using its `draft_id` and returns the message in a 
+    specified draft_format. If the special identifier 'me' is used for 
+    `user_id`, the message is retrieved from the authenticated user's mailbox.
+
+    Args:
+        user_id (str): Email ID of the user whose draft is to be retrieved.
+            - Use "me" to fetch drafts of the authenticated user.
+            - Must be a valid email format if not "me". Defaults to "me".
+            - Example: "user@example.com"
+        draft_id (str): The unique ID of the draft to retrieve.
+            - Example: "123draft456"
+        format (Optional[str]): The format to return the draft message in.
+            - Possible values are "full", "metadata", "minimal" and "raw". 
+            - Defaults to "full", if not provided.
+            - Example: "metadata"
+
+    Returns:
+        Dict[str, Union[str, List[Dict[str, Any]]]]: A dictionary containing:
+            - "status": "success", "error", or "not_found"
+            On success:
+                - "draft" (dict): The message object from the draft response.
+            If not_found:
+                - "message" (str): Message indicating no drafts were found.
+            On error:
+                - "message" (str): An error or info message when applicable.
+
+    Example:
+        Sample Input:
+            get_draft(user_id="me", draft_id="123abc456", format="full")
+
+        Expected Output:
+            {
+                "status": "success",
+                "draft": {
+                    "id": "sample_draft_id",
+                    "threadId": "sample_thread_id",
+                    "labelIds": ["DRAFT"],
+                    "snippet": "Hey John, Hope you are doing well...",
+                    "payload": {...},
+                    "sizeEstimate": 474,
+                    "historyId": "sample_history_id",
+                    "internalDate": "1756132048000"
+                }
+            }
+    """
+    draft_format = draft_format if draft_format else schema.FORMAT_FULL
+
+    if draft_format not in schema.GMAIL_MESSAGE_FORMATS:
+        return {
+            "status": "error",
+            "message": f"Invalid draft format: {draft_format}."
+        }
 
     service = await async_init_gmail_service()
 
-    results = await asyncio.to_thread(
-        lambda: service.users().drafts().list(
-            userId=user_id,
-            q=query,
-            maxResults=max_results,
-            includeSpamTrash=include_spam_and_trash
-        ).execute()
+    request = service.users().drafts().get(
+        userId=user_id,
+        id=draft_id,
+        format=draft_format
     )
 
-    drafts = results.get("drafts", [])
+    draft = await run_gmail_io(request.execute)
 
-    if not drafts:
+    if not draft:
+        return {
+            "status": "not_found", 
+            "message": f"Draft id: {draft_id} not found for user {user_id}"
+        }
+    
+    if "message" not in draft:
         return {
             "status": "not_found",
-            "message": "No drafts found in user's gmail account."
+            "message": f"Draft {draft_id} does not contain a message object."
         }
 
-    draft_list = []
-
-    for draft in drafts:
-        draft_id = draft.get("id")
-        message_id = draft.get("message", {}).get("id")
-
-        thread_id = draft.get("message", {}).get("threadId")
-        label_ids = draft.get("message", {}).get("labelIds", [])
-
-        snippet = draft.get("message", {}).get("snippet")
-
-        draft_list.append({
-            "draft_id": draft_id,
-            "message_id": message_id,
-            "thread_id": thread_id,
-            "label_ids": label_ids,
-            "snippet": snippet
-        })
-
     return {
         "status": "success", 
-        "drafts": draft_list
+        "draft": draft.get("message")
     }
 
 
 @mcp.tool(
-    title="Get Draft",
-    description=schema.GET_DRAFT_DESCRIPTION
+    title="Batch Get Drafts",
+    description=schema.tool_description(
+        schema.BATCH_GET_DRAFTS_DESCRIPTION,
+        "Gets multiple Gmail drafts by id."
+    )
 )
+@validate_ids()
 @handle_gmail_exceptions
-async def get_draft(
+async def batch_get_drafts(
     user_id: Annotated[
         str,
         Field(description="User's email id. Use 'me' for authenticated users.")
     ],
-    draft_id: Annotated[
-        str,
-        Field(description="ID of the draft to retrieve.")
+    draft_ids: Annotated[
+        List[str],
+        Field(description="IDs of the drafts to retrieve.")
     ],
     draft_format: Annotated[
         Optional[schema.GMAIL_MESSAGE_FORMAT],
-        Field(description="Format to return the draft in.")
+        Field(description="Format to return the drafts in.")
     ] = None,
-) -> Dict[str, Union[str, Dict[str, Any]]]:
+) -> Dict[str, Union[str, Dict[str, Dict[str, Any]]]]:
     """
-    Tool to retrieve a specific draft from a user's Gmail account.
+    Tool to retrieve multiple drafts from a user's Gmail account.
 
-    This tool fetches a draft using its `draft_id` and returns the message in a 
-    specified draft_format. If the special identifier 'me' is used for 
-    `user_id`, the message is retrieved from the authenticated user's mailbox.
+    This tool fetches several drafts using the Gmail API's batch endpoint, so 
+    up to 100 drafts are retrieved in a single HTTP round-trip. Larger lists of 
+    IDs are split into chunks of 100 drafts.
 
     Args:
-        user_id (str): Email ID of the user whose draft is to be retrieved.
+        user_id (str): Email ID of the user whose drafts are to be retrieved.
             - Use "me" to fetch drafts of the authenticated user.
-            - Must be a valid email format if not "me". Defaults to "me".
+            - Must be a valid email format if not "me".
             - Example: "user@example.com"
-        draft_id (str): The unique ID of the draft to retrieve.
-            - Example: "123draft456"
-        format (Optional[str]): The format to return the draft message in.
+        draft_ids (List[str]): The unique IDs of the drafts to retrieve.
+            - Example: ["123draft456", "789draft012"]
+        draft_format (Optional[str]): The format to return the drafts in.
             - Possible values are "full", "metadata", "minimal" and "raw". 
             - Defaults to "full", if not provided.
             - Example: "metadata"
 
     Returns:
-        Dict[str, Union[str, List[Dict[str, Any]]]]: A dictionary containing:
+        Dict[str, Union[str, Dict[str, Dict[str, Any]]]]: A dictionary with:
             - "status": "success", "error", or "not_found"
             On success:
-                - "draft" (dict): The message object from the draft response.
+                - "drafts" (dict): Message objects of the drafts, keyed by 
+                   their draft id.
+                - "failed_draft_ids" (list, optional): IDs of drafts that 
+                   could not be retrieved, if any.
             If not_found:
                 - "message" (str): Message indicating no drafts were found.
             On error:
@@ -1038,75 +1698,87 @@ async def get_draft(
 
     Example:
         Sample Input:
-            get_draft(user_id="me", draft_id="123abc456", format="full")
+            batch_get_drafts(
+                user_id="me", 
+                draft_ids=["123draft456", "789draft012"]
+            )
 
         Expected Output:
             {
                 "status": "success",
-                "draft": {
-                    "id": "sample_draft_id",
-                    "threadId": "sample_thread_id",
-                    "labelIds": ["DRAFT"],
-                    "snippet": "Hey John, Hope you are doing well...",
-                    "payload": {...},
-                    "sizeEstimate": 474,
-                    "historyId": "sample_history_id",
-                    "internalDate": "1756132048000"
+                "drafts": {
+                    "123draft456": {
+                        "id": "sample_message_id",
+                        "threadId": "sample_thread_id",
+                        "labelIds": ["DRAFT"],
+                        "snippet": "Hey John, Hope you are doing well...",
+                        "payload": {...}
+                    },
+                    "789draft012": {...}
                 }
             }
     """
-    if not user_id or not user_id.strip():
-        return {
-            "status": "error", 
-            "message": "User Id cannot be empty."
-        }
+    draft_ids = list(dict.fromkeys(
+        draft_id.strip() for draft_id in draft_ids or []
+        if draft_id and draft_id.strip()
+    ))
 
-    if user_id != "me" and not is_valid_email(user_id):
+    if not draft_ids:
         return {
             "status": "error", 
-            "message": "Invalid User Id format."
+            "message": "Draft Ids cannot be empty."
         }
 
-    if not draft_id or not draft_id.strip():
+    draft_format = draft_format if draft_format else schema.FORMAT_FULL
+
+    if draft_format not in schema.GMAIL_MESSAGE_FORMATS:
         return {
-            "status": "error", 
-            "message": "Draft Id cannot be empty."
+            "status": "error",
+            "message": f"Invalid draft format: {draft_format}."
         }
-    
-    draft_format = draft_format if draft_format else "full"
 
     service = await async_init_gmail_service()
 
-    draft = await asyncio.to_thread(
-        lambda: service.users().drafts().get(
+    drafts, failed_draft_ids = await _execute_batched(
+        service,
+        draft_ids,
+        lambda draft_id: service.users().drafts().get(
             userId=user_id,
             id=draft_id,
             format=draft_format
-        ).execute()
+        )
     )
 
-    if not draft:
+    drafts = {
+        draft_id: draft["message"]
+        for draft_id, draft in drafts.items() if draft and "message" in draft
+    }
+
+    if not drafts:
         return {
             "status": "not_found", 
-            "message": f"Draft id: {draft_id} not found for user {user_id}"
-        }
-    
-    if "message" not in draft:
-        return {
-            "status": "not_found",
-            "message": f"Draft {draft_id} does not contain a message object."
+            "message": f"No drafts found for the given ids for {user_id}."
         }
 
-    return {
+    result = {
         "status": "success", 
-        "draft": draft.get("message")
+        "drafts": drafts
     }
 
+    if failed_draft_ids:
+        result["failed_draft_ids"] = failed_draft_ids
+
+    return result
+
 
 @mcp.tool(
     title="Send Draft",
-    description=schema.SEND_DRAFT_DESCRIPTION
+    description=schema.tool_description(
+        schema.SEND_DRAFT_DESCRIPTION,
+        "Sends an existing Gmail draft."
+    )
 )
+@validate_ids(draft_id="Draft Id")
 @handle_gmail_exceptions
 async def send_draft(
     draft_id: Annotated[
@@ -1151,49 +1823,149 @@ async def send_draft(
                 "message": "Email delivered with id: 123abc456."
             }
     """
-    if not user_id or not user_id.strip():
-        return {
-            "status": "error", 
-            "message": "User Id cannot be empty."
-        }
+    service = await async_init_gmail_service()
+
+    request = service.users().drafts().send(
+        userId=user_id, 
+        body={"id": draft_id},
+        fields=schema.GMAIL_ID_FIELDS_MASK
+    )
 
-    if user_id != "me" and not is_valid_email(user_id):
+    response = await run_gmail_io(request.execute)
+
+    _invalidate_profile_cache()
+
+    if not response:
         return {
-            "status": "error", 
-            "message": "Invalid User Id format."
+            "status": "error",
+            "message": "No response received for send operation from Gmail API"
         }
 
-    if not draft_id or not draft_id.strip():
+    return {
+        "status": "success", 
+        "message": f"Email delivered with id: {response.get('id')}."
+    }
+
+
+@mcp.tool(
+    title="Batch Send Drafts",
+    description=schema.tool_description(
+        schema.BATCH_SEND_DRAFTS_DESCRIPTION,
+        "Sends multiple existing Gmail drafts."
+    )
+)
+@validate_ids()
+@handle_gmail_exceptions
+async def batch_send_drafts(
+    user_id: Annotated[
+        str,
+        Field(description="User's email id. Use 'me' for authenticated users.")
+    ],
+    draft_ids: Annotated[
+        List[str],
+        Field(description="IDs of the draft messages to be sent.")
+    ],
+) -> Dict[str, Union[str, List[str]]]:
+    """
+    Tool to send multiple existing drafts from the user's Gmail account.
+
+    The Gmail API offers no batch endpoint for sending drafts, so this tool 
+    sends them concurrently, with at most 8 sends in flight at a time. A draft
+    that fails to send does not stop the others from being sent.
+
+    Args:
+        user_id (str): Unique identifier of the Gmail user account.
+            - Use "me" to indicate the authenticated user
+            - Example: "me"
+        draft_ids (List[str]): The unique IDs of the drafts to be sent.
+            - Example: ["123draft456", "789draft012"]
+
+    Returns:
+        Dict[str, Union[str, List[str]]]: A dictionary containing:
+            - 'status' (str): "success" or "error"
+            On success:
+            - 'message' (str): Delivery confirmation message.
+            - 'message_ids' (list): IDs of the sent messages.
+            - 'failed_draft_ids' (list, optional): IDs of drafts that could 
+               not be sent, if any.
+            On failure:
+            - 'message' (str): Description of the error.
+
+    Example:
+        Sample Input:
+            batch_send_drafts(user_id="me", draft_ids=["ab12", "cd34"])
+
+        Expected Output:
+            {
+                "status": "success",
+                "message": "2 drafts have been sent.",
+                "message_ids": ["msg12", "msg34"]
+            }
+    """
+    draft_ids = list(dict.fromkeys(
+        draft_id.strip() for draft_id in draft_ids or []
+        if draft_id and draft_id.strip()
+    ))
+
+    if not draft_ids:
         return {
             "status": "error", 
-            "message": "Draft Id cannot be empty."
+            "message": "Draft Ids cannot be empty."
         }
 
     service = await async_init_gmail_service()
+    semaphore = asyncio.Semaphore(schema.GMAIL_CONCURRENT_SEND_LIMIT)
+
+    async def send_one(draft_id: str) -> Dict[str, Any]:
+        async with semaphore:
+            request = service.users().drafts().send(
+                userId=user_id,
+                body={"id": draft_id},
+                fields=schema.GMAIL_ID_FIELDS_MASK
+            )
+            return await run_gmail_io(request.execute)
 
-    response = await asyncio.to_thread(
-        lambda: service.users().drafts().send(
-            userId=user_id, 
-            body={"id": draft_id}
-        ).execute()
+    responses = await asyncio.gather(
+        *(send_one(draft_id) for draft_id in draft_ids),
+        return_exceptions=True
     )
 
-    if not response:
+    _invalidate_profile_cache()
+
+    message_ids, failed_draft_ids = [], []
+
+    for draft_id, response in zip(draft_ids, responses):
+        if isinstance(response, Exception) or not response:
+            failed_draft_ids.append(draft_id)
+        else:
+            message_ids.append(response.get("id"))
+
+    if not message_ids:
         return {
             "status": "error",
-            "message": "No response received for send operation from Gmail API"
+            "message": "None of the given drafts could be sent."
         }
 
-    return {
-        "status": "success", 
-        "message": f"Email delivered with id: {response.get('id')}."
+    result = {
+        "status": "success",
+        "message": f"{len(message_ids)} drafts have been sent.",
+        "message_ids": message_ids
     }
 
+    if failed_draft_ids:
+        result["failed_draft_ids"] = failed_draft_ids
+
+    return result
+
 
 @mcp.tool(
     title="Create Draft",
-    description=schema.CREATE_DRAFT_DESCRIPTION
+    description=schema.tool_description(
+        schema.CREATE_DRAFT_DESCRIPTION,
+        "Creates a new Gmail draft."
+    )
 )
+@validate_ids()
 @handle_gmail_exceptions
 async def create_draft(
     user_id: Annotated[
@@ -1284,78 +2056,34 @@ async def create_draft(
                 "message": "Draft created with id: `123abc456`.",
             }
     """
-    if not user_id or not user_id.strip():
-        return {
-            "status": "error", 
-            "message": "User Id cannot be empty."
-        }
-
-    if user_id != "me" and not is_valid_email(user_id):
-        return {
-            "status": "error", 
-            "message": "Invalid User Id format."
-        }
-
-    invalid_to_email = []
-
-    if to and to.strip():
-        valid_to = []
-        to = re.sub(r"[\(\)\[\]\{\}\<\>]", "", to)
-
-        for email in re.split(r",\s*", to):
-            if not is_valid_email(email.strip()):
-                invalid_to_email.append(email.strip())
-
-            else:
-                valid_to.append(email)
-
-        to = ", ".join(valid_to)
+    valid_to, invalid_to_email = partition_email_addresses(to or "")
+    to = ", ".join(valid_to)
 
-    subject = "(No Subject)" if not subject or not subject.strip() else subject
+    if not subject or not subject.strip():
+        subject = schema.GMAIL_NO_SUBJECT
 
-    if in_reply_to and not subject.lower().startswith('re:'):
+    if in_reply_to and not subject.startswith(schema.GMAIL_REPLY_PREFIXES):
         subject = f"Re: {subject}"
 
-    message = MIMEText(body or "")
+    headers = []
 
     if user_id != "me":
-        message["From"] = user_id
+        headers.append(("From", user_id))
 
     if to:
-        message['To'] = to
-
-    message['Subject'] = subject
+        headers.append(("To", to))
 
-    valid_cc = []
-    invalid_cc_email = []
+    headers.append(("Subject", subject))
 
-    if cc:
-        cc = re.sub(r"[\(\)\[\]\{\}\<\>]", "", cc)
+    valid_cc, invalid_cc_email = partition_email_addresses(cc or "")
 
-        for email in re.split(r",\s*", cc):
-            if not is_valid_email(email.strip()):
-                invalid_cc_email.append(email.strip())
+    if valid_cc:
+        headers.append(("Cc", ", ".join(valid_cc)))
 
-            else:
-                valid_cc.append(email)
+    valid_bcc, invalid_bcc_email = partition_email_addresses(bcc or "")
 
-        if valid_cc:
-            message['Cc'] = ", ".join(valid_cc)
-
-    valid_bcc = []
-    invalid_bcc_email = []
-
-    if bcc:
-        bcc = re.sub(r"[\(\)\[\]\{\}\<\>]", "", bcc)
-
-        for email in re.split(r",\s*", bcc):
-            if not is_valid_email(email.strip()):
-                invalid_bcc_email.append(email.strip())
-            else:
-                valid_bcc.append(email)
-
-        if valid_bcc:
-            message['Bcc'] = ", ".join(valid_bcc)
+    if valid_bcc:
+        headers.append(("Bcc", ", ".join(valid_bcc)))
     
     if not (to or cc or bcc):
         return {
@@ -1364,10 +2092,14 @@ async def create_draft(
         }
 
     if in_reply_to:
-        message['In-Reply-To'] = in_reply_to
-        message['References'] = in_reply_to
+        headers.append(("In-Reply-To", in_reply_to))
+        headers.append(("References", in_reply_to))
 
-    raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
+    raw_message = await asyncio.to_thread(
+        lambda: encode_raw_message(
+            compose_plain_text_message(headers, body or "")
+        )
+    )
     message_payload = {"raw": raw_message}
 
     if thread_id:
@@ -1375,13 +2107,16 @@ async def create_draft(
 
     service = await async_init_gmail_service()
 
-    response = await asyncio.to_thread(
-        lambda: service.users().drafts().create(
-            userId=user_id, 
-            body={"message": message_payload}
-        ).execute()
+    request = service.users().drafts().create(
+        userId=user_id, 
+        body={"message": message_payload},
+        fields=schema.GMAIL_ID_FIELDS_MASK
     )
 
+    response = await run_gmail_io(request.execute)
+
+    _invalidate_profile_cache()
+
     result = {
         "status": "success", 
         "message": f"Draft created with id: {response.get('id')}"
@@ -1409,8 +2144,12 @@ async def create_draft(
 
 @mcp.tool(
     title="Update Draft",
-    description=schema.UPDATE_DRAFT_DESCRIPTION
+    description=schema.tool_description(
+        schema.UPDATE_DRAFT_DESCRIPTION,
+        "Updates an existing Gmail draft."
+    )
 )
+@validate_ids(draft_id="Draft Id")
 @handle_gmail_exceptions
 async def update_draft(
     user_id: Annotated[
@@ -1507,152 +2246,93 @@ async def update_draft(
                 "message": "Draft updated successfully with id: 123abc456.",
             }
     """
-    if not user_id or not user_id.strip():
-        return {
-            "status": "error", 
-            "message": "User Id cannot be empty."
-        }
-
-    if user_id != "me" and not is_valid_email(user_id):
-        return {
-            "status": "error", 
-            "message": "Invalid User Id format."
-        }
-
-    if not draft_id or not draft_id.strip():
-        return {
-            "status": "error", 
-            "message": "Draft Id cannot be empty."
-        }
-
     service = await async_init_gmail_service()
 
-    existing_draft = await asyncio.to_thread(
-        lambda: service.users().drafts().get(
-            userId=user_id,
-            id=draft_id
-        ).execute()
+    # Recipients are merged as deltas, so the existing headers are always
+    # needed; the stored body is only fetched when it will be reused.
+    request = service.users().drafts().get(
+        userId=user_id,
+        id=draft_id,
+        fields=(
+            schema.GMAIL_DRAFT_CONTENT_FIELDS_MASK if body is None
+            else schema.GMAIL_DRAFT_HEADERS_FIELDS_MASK
+        )
     )
 
+    existing_draft = await run_gmail_io(request.execute)
+
     existing_message = existing_draft.get("message", {}).get("payload", {})
-    existing_body = ""
 
-    if "body" in existing_message and "data" in existing_message["body"]:
-        existing_body = base64.urlsafe_b64decode(
-            existing_message["body"]["data"].encode("UTF-8")
-        ).decode("utf-8")
+    if body is None:
+        body = ""
+        message_body = existing_message.get("body", {})
+
+        if "data" in message_body:
+            body = decode_message_data(message_body["data"])
 
-    elif "parts" in existing_message:
-        for part in existing_message["parts"]:
-            if part["mimeType"] == "text/plain" and "data" in part["body"]:
-                existing_body = base64.urlsafe_b64decode(
-                    part["body"]["data"].encode("UTF-8")
-                ).decode("utf-8")
-                break
+        elif "parts" in existing_message:
+            # The fields mask drops empty objects, so a part may have no
+            # body (or no mimeType) at all.
+            for part in existing_message["parts"]:
+                part_body = part.get("body", {})
 
-    message = MIMEText(body if body is not None else existing_body)
+                if part.get("mimeType") == "text/plain" and "data" in part_body:
+                    body = decode_message_data(part_body["data"])
+                    break
 
     headers = {
         h["name"]: h["value"] for h in existing_message.get("headers", [])
     }
 
+    message_headers = []
+
     if subject:
         if subject.strip():
-            message["Subject"] = subject.strip()
+            message_headers.append(("Subject", subject.strip()))
         else:
-            message["Subject"] = "(No Subject)"
+            message_headers.append(("Subject", schema.GMAIL_NO_SUBJECT))
 
     else:
-        message["Subject"] = headers.get("Subject", "(No Subject)")
-
-    existing_to = [
-        to for to in re.split(r",\s*", headers.get("To", "")) if to
-    ]
-
-    invalid_to_email = []
-
-    if add_to:
-        for email in add_to:
-            if is_valid_email(email):
-                existing_to.append(email)
-            else:
-                invalid_to_email.append(email)
-
-    if remove_to:
-        for email in remove_to:
-            if is_valid_email(email):
-                try:
-                    existing_to.remove(email)
-                except ValueError:
-                    pass
-            else:
-                invalid_to_email.append(email)
-
-    message["To"] = ", ".join(list(set(existing_to)))
-
-    existing_cc = [
-        cc for cc in re.split(r",\s*", headers.get("Cc", "")) if cc
-    ]
-    invalid_cc_email = []
-
-    if add_cc:
-        for email in add_cc:
-            if is_valid_email(email):
-                existing_cc.append(email)
-            else:
-                invalid_cc_email.append(email)
-
-    if remove_cc:
-        for email in remove_cc:
-            if is_valid_email(email):
-                try:
-                    existing_cc.remove(email)
-                except ValueError:
-                    pass
-            else:
-                invalid_cc_email.append(email)
-
-    message['Cc'] = ", ".join(list(set(existing_cc)))
-
-    existing_bcc = [
-        bcc for bcc in re.split(r",\s*", headers.get("Bcc", "")) if bcc
-    ]
+        message_headers.append(
+            ("Subject", headers.get("Subject", schema.GMAIL_NO_SUBJECT))
+        )
 
-    invalid_bcc_email = []
-
-    if add_bcc:
-        for email in add_bcc:
-            if is_valid_email(email):
-                existing_bcc.append(email)
-            else:
-                invalid_bcc_email.append(email)
+    merged_to, invalid_to_email = _merge_recipients(
+        headers.get("To", ""), add_to, remove_to
+    )
+    message_headers.append(("To", merged_to))
 
-    if remove_bcc:
-        for email in remove_bcc:
-            if is_valid_email(email):
-                try:
-                    existing_bcc.remove(email)
-                except ValueError:
-                    pass
-            else:
-                invalid_bcc_email.append(email)
+    merged_cc, invalid_cc_email = _merge_recipients(
+        headers.get("Cc", ""), add_cc, remove_cc
+    )
+    message_headers.append(("Cc", merged_cc))
 
-    message['Bcc'] = ", ".join(list(set(existing_bcc)))
+    merged_bcc, invalid_bcc_email = _merge_recipients(
+        headers.get("Bcc", ""), add_bcc, remove_bcc
+    )
+    message_headers.append(("Bcc", merged_bcc))
 
-    raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
+    raw_message = await asyncio.to_thread(
+        lambda: encode_raw_message(
+            compose_plain_text_message(message_headers, body)
+        )
+    )
 
     message_payload = {
         "message": {"raw": raw_message}
     }
 
-    response = await asyncio.to_thread(
-        lambda: service.users().drafts().update(
-            userId=user_id,
-            id=draft_id,
-            body=message_payload
-        ).execute()
+    request = service.users().drafts().update(
+        userId=user_id,
+        id=draft_id,
+        body=message_payload,
+        fields=schema.GMAIL_ID_FIELDS_MASK
     )
 
+    response = await run_gmail_io(request.execute)
+
+    _invalidate_profile_cache()
+
     result = {
         "status": "success",
         "message": f"Draft updated successfully with id: {response['id']}."
@@ -1680,8 +2360,12 @@ async def update_draft(
 
 @mcp.tool(
     title="Delete Draft",
-    description=schema.DELETE_DRAFT_DESCRIPTION
+    description=schema.tool_description(
+        schema.DELETE_DRAFT_DESCRIPTION,
+        "Permanently deletes a Gmail draft."
+    )
 )
+@validate_ids(draft_id="Draft Id")
 @handle_gmail_exceptions
 async def delete_draft(
     user_id: Annotated[
@@ -1725,38 +2409,117 @@ async def delete_draft(
                 "message": "Draft with id: `ab12` has been deleted permanently"
             }
     """
-    if not user_id or not user_id.strip():
-        return {
-            "status": "error", 
-            "message": "User Id cannot be empty."
-        }
+    service = await async_init_gmail_service()
 
-    if user_id != "me" and not is_valid_email(user_id):
-        return {
-            "status": "error", 
-            "message": "Invalid User Id format."
-        }
+    request = service.users().drafts().delete(
+        userId=user_id,
+        id=draft_id
+    )
+
+    await run_gmail_io(request.execute)
+
+    _invalidate_profile_cache()
+
+    return {
+        "status": "success",
+        "message": f"Draft with id: {draft_id} has been deleted permanently."
+    }
+
+
+@mcp.tool(
+    title="Batch Delete Drafts",
+    description=schema.tool_description(
+        schema.BATCH_DELETE_DRAFTS_DESCRIPTION,
+        "Permanently deletes multiple Gmail drafts."
+    )
+)
+@validate_ids()
+@handle_gmail_exceptions
+async def batch_delete_drafts(
+    user_id: Annotated[
+        str,
+        Field(description="User's email id. Use 'me' for authenticated users.")
+    ],
+    draft_ids: Annotated[
+        List[str],
+        Field(description="IDs of the drafts to delete.")
+    ],
+) -> Dict[str, Union[str, List[str]]]:
+    """
+    Tool to delete multiple gmail drafts from the user's Gmail account.
+
+    This tool immediately and permanently deletes the specified drafts using the 
+    Gmail API's batch endpoint, so up to 100 drafts are deleted in a single HTTP 
+    round-trip. The drafts are not moved to the trashed folder. This action 
+    cannot be undone. **Use with caution.**
+    
+    Args:
+        user_id (str): Unique identifier of the Gmail user account.
+            - Use "me" to indicate the authenticated user
+            - Example: "me"
+        draft_ids (List[str]): The unique IDs of the drafts to be deleted.
+            - Example: ["123draft456", "789draft012"]
+
+    Returns:
+        Dict[str, Union[str, List[str]]]: A dictionary containing:
+            - 'status' (str): "success" or "error"
+            On success:
+            - 'message' (str): Confirmation message.
+            - 'failed_draft_ids' (list, optional): IDs of drafts that could 
+               not be deleted, if any.
+            On failure:
+            - 'message' (str): Description of the error.
+    
+    Example:
+        Sample Input:
+            batch_delete_drafts(user_id="me", draft_ids=["ab12", "cd34"])
+
+        Expected Output:
+            {
+                "status": "success",
+                "message": "2 drafts have been deleted permanently."
+            }
+    """
+    draft_ids = list(dict.fromkeys(
+        draft_id.strip() for draft_id in draft_ids or []
+        if draft_id and draft_id.strip()
+    ))
 
-    if not draft_id or not draft_id.strip():
+    if not draft_ids:
         return {
             "status": "error", 
-            "message": "Draft Id cannot be empty."
+            "message": "Draft Ids cannot be empty."
         }
 
     service = await async_init_gmail_service()
 
-    await asyncio.to_thread(
-        lambda: service.users().drafts().delete(
+    deleted, failed_draft_ids = await _execute_batched(
+        service,
+        draft_ids,
+        lambda draft_id: service.users().drafts().delete(
             userId=user_id,
             id=draft_id
-        ).execute()
+        )
     )
 
-    return {
+    _invalidate_profile_cache()
+
+    if not deleted:
+        return {
+            "status": "error",
+            "message": "None of the given drafts could be deleted."
+        }
+
+    result = {
         "status": "success",
-        "message": f"Draft with id: {draft_id} has been deleted permanently."
+        "message": f"{len(deleted)} drafts have been deleted permanently."
     }
 
+    if failed_draft_ids:
+        result["failed_draft_ids"] = failed_draft_ids
+
+    return result
+
 
 if __name__ == "__main__":
     TRANSPORT_PROTOCOL = 'stdio'
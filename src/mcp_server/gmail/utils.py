@@ -13,15 +13,33 @@
 # limitations under the License.
 
 import re
+import asyncio
+import inspect
 import logging
 import functools
+from concurrent.futures import ThreadPoolExecutor
+from email.mime.text import MIMEText
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from googleapiclient.errors import HttpError
 
+from auth import invalidate_gmail_service
+
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 logger = logging.getLogger(__name__)
 
+GMAIL_IO_MAX_WORKERS = 20
+
+_gmail_io_executor = ThreadPoolExecutor(
+    max_workers=GMAIL_IO_MAX_WORKERS, thread_name_prefix="gmail-io"
+)
+
 
 EMAIL_REGEX = re.compile(
-        r"^(?:[a-z0-9!#$%&'*+/=?^_`{|}~-]+"
+        r"(?:[a-z0-9!#$%&'*+/=?^_`{|}~-]+"
         r"(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*"
         r'|"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21\x23-\x5b\x5d-\x7f]'
         r'|\\[\x01-\x09\x0b\x0c\x0e-\x7f])*")'
@@ -30,21 +48,179 @@ EMAIL_REGEX = re.compile(
         r"|\[(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}"
         r"(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[a-z0-9-]*[a-z0-9]:"
         r"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21-\x5a\x53-\x7f]"
-        r'|\\[\x01-\x09\x0b\x0c\x0e-\x7f])+)\])$', 
-        re.IGNORECASE
+        r'|\\[\x01-\x09\x0b\x0c\x0e-\x7f])+)\])', 
+        re.IGNORECASE | re.ASCII
     )
 
+MAX_LINE_LENGTH = 998
+MAX_EMAIL_LENGTH = 254
+MAX_LOCAL_PART_LENGTH = 64
+
+ADDR_STRIP_TABLE = str.maketrans("", "", "()[]{}<>")
+
+@functools.lru_cache(maxsize=10000)
+def _matches_email(email: str) -> bool:
+    # Linear checks on the RFC 5321 size limits and the "@" split run first,
+    # so the regex only ever sees short, plausibly shaped addresses.
+    if len(email) > MAX_EMAIL_LENGTH or not email.isascii():
+        return False
+
+    at = email.rfind("@")
+
+    if not 0 < at <= MAX_LOCAL_PART_LENGTH or at == len(email) - 1:
+        return False
+
+    return EMAIL_REGEX.fullmatch(email) is not None
+
 def is_valid_email(email: str) -> bool:
     if not isinstance(email, str):
         return False
 
-    return bool(EMAIL_REGEX.match(email))
+    return _matches_email(email)
+
+async def run_gmail_io(fn: Callable[[], Any]) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_gmail_io_executor, fn)
+
+def partition_email_addresses(raw: str) -> Tuple[List[str], List[str]]:
+    valid, invalid = [], []
+    parts = raw.translate(ADDR_STRIP_TABLE).split(",")
+
+    for email in dict.fromkeys(filter(None, map(str.strip, parts))):
+        (valid if is_valid_email(email) else invalid).append(email)
+
+    return valid, invalid
+
+# Validation errors are built once and shared; callers only serialize them.
+EMPTY_USER_ID_ERROR = {
+    "status": "error", 
+    "message": "User Id cannot be empty."
+}
+
+INVALID_USER_ID_ERROR = {
+    "status": "error", 
+    "message": "Invalid User Id format."
+}
+
+@functools.lru_cache(maxsize=None)
+def _empty_id_error(label: str) -> Dict[str, str]:
+    return {
+        "status": "error", 
+        "message": f"{label} cannot be empty."
+    }
+
+def validate_user_id(user_id: str) -> Optional[Dict[str, str]]:
+    # "me" is by far the most common value, so accept it before any checks.
+    if user_id == "me":
+        return None
+
+    if not user_id:
+        return EMPTY_USER_ID_ERROR
+
+    if not is_valid_email(user_id):
+        return INVALID_USER_ID_ERROR
+
+    return None
+
+def validate_id(resource_id: str, label: str) -> Optional[Dict[str, str]]:
+    if not resource_id:
+        return _empty_id_error(label)
+
+    return None
+
+def validate_ids(**id_labels: str):
+    # Strips and validates user_id plus the named id parameters (mapped to
+    # the label used in error messages) before the tool body runs.
+    id_items = tuple(id_labels.items())
+
+    def check_user_id(kwargs: Dict[str, Any]) -> Optional[Dict[str, str]]:
+        user_id = kwargs["user_id"] = (kwargs.get("user_id") or "").strip()
+        return validate_user_id(user_id)
+
+    def check_all_ids(kwargs: Dict[str, Any]) -> Optional[Dict[str, str]]:
+        if error := check_user_id(kwargs):
+            return error
+
+        for name, label in id_items:
+            resource_id = kwargs[name] = (kwargs.get(name) or "").strip()
+
+            if error := validate_id(resource_id, label):
+                return error
+
+        return None
+
+    # Tools without resource ids never enter the id loop at all.
+    check_ids = check_all_ids if id_items else check_user_id
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+
+            if error := check_ids(bound.arguments):
+                return error
+
+            return await func(**bound.arguments)
+
+        return wrapper
+
+    return decorator
+
+def _is_plain_header_value(value: str) -> bool:
+    return value.isascii() and "\r" not in value and "\n" not in value
+
+def compose_plain_text_message(
+    headers: List[Tuple[str, str]], body: str
+) -> bytes:
+    # Writes 7bit text/plain messages directly and only falls back to the
+    # MIMEText policy machinery when headers or body would need encoding.
+    if body.isascii() and "\r" not in body and all(
+        len(name) + len(value) + 2 <= MAX_LINE_LENGTH
+        and _is_plain_header_value(value)
+        for name, value in headers
+    ) and all(
+        len(line) <= MAX_LINE_LENGTH for line in body.split("\n")
+    ):
+        lines = [
+            'Content-Type: text/plain; charset="us-ascii"',
+            "MIME-Version: 1.0",
+            "Content-Transfer-Encoding: 7bit",
+        ]
+        lines.extend(f"{name}: {value}" for name, value in headers)
+
+        return ("\n".join(lines) + "\n\n" + body).encode("ascii")
+
+    message = MIMEText(body)
+
+    for name, value in headers:
+        message[name] = value
+
+    return message.as_bytes()
+
+def encode_raw_message(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+def decode_message_data(data: str) -> str:
+    return base64.urlsafe_b64decode(data).decode("utf-8")
 
 def handle_gmail_exceptions(func):
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
         try:
-            return await func(*args, **kwargs)
+            try:
+                return await func(*args, **kwargs)
+
+            except HttpError as http_error:
+                if http_error.resp.status != 401:
+                    raise
+
+                # A 401 usually means the cached service holds a stale token,
+                # so rebuild it and give the tool one more attempt.
+                invalidate_gmail_service()
+                return await func(*args, **kwargs)
 
         except HttpError as http_error:
             status = http_error.resp.status